@@ -0,0 +1,30 @@
+"""Compare the throughput of the DRBG backend against plain `urandom`."""
+
+from __future__ import annotations
+
+import os
+from timeit import timeit
+
+from ixia import DRBG
+
+TOTAL = 1 << 28  # 256 MiB per measurement
+
+
+def _throughput(source: DRBG | None, chunk: int) -> float:
+    read = os.urandom if source is None else source.rand_bytes
+    calls = TOTAL // chunk
+    seconds = timeit(lambda: read(chunk), number=calls)
+    return TOTAL / seconds / (1 << 20)
+
+
+def main() -> None:
+    drbg = DRBG()
+    print(f"{'chunk':>10} {'urandom MiB/s':>15} {'DRBG MiB/s':>15}")
+    for chunk in (7, 64, 4096, 1 << 20):
+        urandom_rate = _throughput(None, chunk)
+        drbg_rate = _throughput(drbg, chunk)
+        print(f"{chunk:>10} {urandom_rate:>15.1f} {drbg_rate:>15.1f}")
+
+
+if __name__ == "__main__":
+    main()
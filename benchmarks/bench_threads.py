@@ -0,0 +1,49 @@
+"""Measure how throughput scales with the number of threads."""
+
+from __future__ import annotations
+
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+from typing import Callable
+
+from ixia import choices, rand_int, random
+
+OPS_PER_THREAD = 100_000
+SEQ = list(range(100))
+
+
+def _run(func: Callable[[], object], threads: int) -> float:
+    def work() -> None:
+        for _ in range(OPS_PER_THREAD):
+            func()
+
+    with ThreadPoolExecutor(threads) as pool:
+        start = perf_counter()
+        for future in [pool.submit(work) for _ in range(threads)]:
+            future.result()
+        elapsed = perf_counter() - start
+    return threads * OPS_PER_THREAD / elapsed
+
+
+def main() -> None:
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Python {sys.version.split()[0]}, GIL {'enabled' if gil else 'disabled'}")
+    benchmarks: dict[str, Callable[[], object]] = {
+        "random()": random,
+        "rand_int(1, 6)": lambda: rand_int(1, 6),
+        "choices(seq, k=10)": lambda: choices(SEQ, k=10),
+    }
+    max_threads = os.cpu_count() or 1
+    counts = sorted({1, 2, 4, 8, max_threads} & set(range(1, max_threads + 1)))
+    for name, func in benchmarks.items():
+        base = _run(func, 1)
+        print(f"\n{name}")
+        for threads in counts:
+            rate = _run(func, threads)
+            print(f"{threads:>4} threads: {rate:>12,.0f} ops/s ({rate / base:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
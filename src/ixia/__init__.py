@@ -1,74 +1,154 @@
-from .date_time import rand_date, rand_time
+from .date_time import rand_date, rand_dates, rand_time, rand_times
 from .distributions import (
+    EmpiricalDistribution,
+    MultivariateNormal,
     beta_variate,
+    beta_variates,
     binomial_variate,
+    dirichlet_variate,
+    dirichlet_variates,
     expo_variate,
     gamma_variate,
+    gamma_variates,
     gauss,
+    geometric_variate,
+    geometric_variates,
+    hypergeometric_variate,
+    hypergeometric_variates,
     log_norm_variate,
+    multinomial,
+    multivariate_hypergeometric,
+    negative_binomial_variate,
+    negative_binomial_variates,
     normal_variate,
     pareto_variate,
+    poisson_variate,
+    poisson_variates,
     random,
     triangular,
+    truncated_expo_variate,
+    truncated_normal_variate,
     uniform,
     von_mises_variate,
     weibull_variate,
 )
+from .drbg import DRBG, fast_mode, use_drbg, use_urandom
+from .files import shuffle_file, write_random
+from .ids import rand_ulid, rand_ulids, rand_uuid7, rand_uuid7s
 from .integers import (
     rand_below,
     rand_bits,
     rand_bool,
+    rand_bools,
     rand_int,
     rand_ints,
     rand_range,
     universe_rand,
 )
-from .sequences import choice, choices, perm, rand_enum, sample, shuffle, shuffled
+from .regex import RegexGenerator, rand_regex
+from .sequences import (
+    DynamicWeightedSampler,
+    choice,
+    choices,
+    perm,
+    rand_enum,
+    rand_filter,
+    rand_indices,
+    sample,
+    shuffle,
+    shuffled,
+    sorted_sample,
+)
 from .strings import (
+    RandomStream,
     passphrase,
     rand_alnum,
     rand_bytes,
     rand_hex,
+    rand_into,
     rand_line,
+    rand_password,
     rand_printable,
     rand_urlsafe,
+    tokens,
 )
 
 __all__ = (
+    "DRBG",
+    "DynamicWeightedSampler",
+    "EmpiricalDistribution",
+    "MultivariateNormal",
+    "RandomStream",
+    "RegexGenerator",
     "beta_variate",
+    "beta_variates",
     "binomial_variate",
     "choice",
     "choices",
+    "dirichlet_variate",
+    "dirichlet_variates",
     "expo_variate",
+    "fast_mode",
     "gamma_variate",
+    "gamma_variates",
     "gauss",
+    "geometric_variate",
+    "geometric_variates",
+    "hypergeometric_variate",
+    "hypergeometric_variates",
     "log_norm_variate",
+    "multinomial",
+    "multivariate_hypergeometric",
+    "negative_binomial_variate",
+    "negative_binomial_variates",
     "normal_variate",
     "pareto_variate",
     "passphrase",
     "perm",
+    "poisson_variate",
+    "poisson_variates",
     "rand_alnum",
     "rand_below",
     "rand_bits",
     "rand_bool",
+    "rand_bools",
     "rand_bytes",
     "rand_date",
+    "rand_dates",
     "rand_enum",
+    "rand_filter",
     "rand_hex",
+    "rand_indices",
     "rand_int",
+    "rand_into",
     "rand_ints",
     "rand_line",
+    "rand_password",
     "rand_printable",
     "rand_range",
+    "rand_regex",
     "rand_time",
+    "rand_times",
+    "rand_ulid",
+    "rand_ulids",
     "rand_urlsafe",
+    "rand_uuid7",
+    "rand_uuid7s",
     "random",
     "sample",
     "shuffle",
+    "shuffle_file",
     "shuffled",
+    "sorted_sample",
+    "tokens",
     "triangular",
+    "truncated_expo_variate",
+    "truncated_normal_variate",
     "uniform",
     "universe_rand",
+    "use_drbg",
+    "use_urandom",
     "von_mises_variate",
     "weibull_variate",
+    "write_random",
 )
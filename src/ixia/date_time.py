@@ -1,9 +1,15 @@
 from __future__ import annotations
 
 import datetime as dt
-from typing import Union
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import accumulate
+from typing import TYPE_CHECKING, Union
 
-from .integers import rand_below, rand_int
+from .integers import rand_below
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
 
 Datelike = Union[str, int, tuple[int, int, int], dt.date, dt.datetime]
 Timelike = Union[
@@ -15,6 +21,9 @@ Timelike = Union[
     dt.time,
     dt.datetime,
 ]
+# Valid values as runs of consecutive integers: the first value of every run,
+# the number of valid values before every run, and the total number of values
+_Index = tuple[tuple[int, ...], tuple[int, ...], int]
 
 
 def _convert_date(date: Datelike) -> dt.date:
@@ -50,10 +59,47 @@ def _microseconds(time: dt.time) -> int:
     )
 
 
-def rand_date(start: Datelike, end: Datelike | None = None) -> dt.date:
-    """
-    Return a random date between start and end. If end is None, defaults to Dec 31.
-    """
+def _from_microseconds(us: int) -> dt.time:
+    out, us = divmod(us, 1_000_000)
+    out, s = divmod(out, 60)
+    h, m = divmod(out, 60)
+    return dt.time(h, m, s, us)
+
+
+def _draw(index: _Index) -> int:
+    # One bounded random integer, mapped onto the runs with a binary search
+    starts, offsets, total = index
+    r = rand_below(total)
+    i = bisect_right(offsets, r) - 1
+    return starts[i] + r - offsets[i]
+
+
+@lru_cache(maxsize=64)
+def _date_index(
+    first: int, last: int, weekdays: frozenset[int], exclude: frozenset[int]
+) -> _Index:
+    starts: list[int] = []
+    offsets: list[int] = []
+    total = 0
+    previous = first - 2
+    for day in range(first, last + 1):
+        # Ordinal 1 (0001-01-01) is a Monday
+        if (day - 1) % 7 not in weekdays or day in exclude:
+            continue
+        if day != previous + 1:
+            starts.append(day)
+            offsets.append(total)
+        previous = day
+        total += 1
+    return tuple(starts), tuple(offsets), total
+
+
+def _date_sampler(
+    start: Datelike,
+    end: Datelike | None,
+    weekdays: Iterable[int] | None,
+    exclude: Iterable[Datelike],
+) -> _Index:
     start = _convert_date(start)
     if end is None:
         end = dt.date(start.year, 12, 31)
@@ -61,19 +107,114 @@ def rand_date(start: Datelike, end: Datelike | None = None) -> dt.date:
         end = dt.date(end, 12, 31)
     else:
         end = _convert_date(end)
-    return start + dt.timedelta(days=rand_below((end - start).days + 1))
+    first, last = start.toordinal(), end.toordinal()
+    excluded = frozenset(_convert_date(date).toordinal() for date in exclude)
+    if weekdays is None and not excluded:
+        index: _Index = ((first,), (0,), last - first + 1)
+    else:
+        days = frozenset(range(7) if weekdays is None else weekdays)
+        if not days <= frozenset(range(7)):
+            msg = "weekdays must be integers in range [0, 6]"
+            raise ValueError(msg)
+        index = _date_index(first, last, days, excluded)
+    if index[2] <= 0:
+        msg = "no date in range satisfies the constraints"
+        raise ValueError(msg)
+    return index
 
 
-def rand_time(start: Timelike | None = None, end: Timelike | None = None) -> dt.time:
+def rand_date(
+    start: Datelike,
+    end: Datelike | None = None,
+    *,
+    weekdays: Iterable[int] | None = None,
+    exclude: Iterable[Datelike] = (),
+) -> dt.date:
+    """
+    Return a random date between start and end. If end is None, defaults to Dec 31.
+    Only dates falling on `weekdays` (0 is Monday) and not in `exclude` are chosen.
+    """
+    return dt.date.fromordinal(_draw(_date_sampler(start, end, weekdays, exclude)))
+
+
+def rand_dates(
+    start: Datelike,
+    end: Datelike | None = None,
+    *,
+    weekdays: Iterable[int] | None = None,
+    exclude: Iterable[Datelike] = (),
+    k: int,
+) -> list[dt.date]:
+    """Return a list of `k` random dates, with the same arguments as `rand_date`."""
+    index = _date_sampler(start, end, weekdays, exclude)
+    return [dt.date.fromordinal(_draw(index)) for _ in range(k)]
+
+
+@lru_cache(maxsize=64)
+def _time_index(windows: tuple[tuple[int, int], ...]) -> _Index:
+    # Merge overlapping and adjacent windows, so that no time is more likely
+    merged: list[list[int]] = []
+    for lo, hi in sorted(windows):
+        if merged and lo <= merged[-1][1] + 1:
+            merged[-1][1] = max(merged[-1][1], hi)
+        else:
+            merged.append([lo, hi])
+    sizes = [hi - lo + 1 for lo, hi in merged]
+    offsets = tuple(accumulate(sizes, initial=0))
+    return tuple(lo for lo, _ in merged), offsets[:-1], offsets[-1]
+
+
+def _time_sampler(
+    start: Timelike | None,
+    end: Timelike | None,
+    windows: Iterable[tuple[Timelike, Timelike]] | None,
+) -> _Index:
+    if windows is None:
+        lo = _microseconds(dt.time.min if start is None else _convert_time(start))
+        hi = _microseconds(dt.time.max if end is None else _convert_time(end))
+        if lo > hi:
+            msg = "empty range for rand_time"
+            raise ValueError(msg)
+        return (lo,), (0,), hi - lo + 1
+    if start is not None or end is not None:
+        msg = "windows cannot be combined with start or end"
+        raise ValueError(msg)
+    bounds = tuple(
+        (_microseconds(_convert_time(lo)), _microseconds(_convert_time(hi)))
+        for lo, hi in windows
+    )
+    if not bounds:
+        msg = "no time windows given"
+        raise ValueError(msg)
+    if any(lo > hi for lo, hi in bounds):
+        msg = "time windows must not end before they start"
+        raise ValueError(msg)
+    return _time_index(bounds)
+
+
+def rand_time(
+    start: Timelike | None = None,
+    end: Timelike | None = None,
+    *,
+    windows: Iterable[tuple[Timelike, Timelike]] | None = None,
+) -> dt.time:
     """
     Return a random time between start and end.
     If start is None, defaults to 00:00:00.
     If end is None, defaults to 23:59:59.999999.
+    If `windows` is given instead, return a random time within any of the
+    (start, end) windows.
     """
-    start = dt.time.min if start is None else _convert_time(start)
-    end = dt.time.max if end is None else _convert_time(end)
-    out = rand_int(_microseconds(start), _microseconds(end))
-    out, us = divmod(out, 1_000_000)
-    out, s = divmod(out, 60)
-    h, m = divmod(out, 60)
-    return dt.time(h, m, s, us)
+    return _from_microseconds(_draw(_time_sampler(start, end, windows)))
+
+
+def rand_times(
+    start: Timelike | None = None,
+    end: Timelike | None = None,
+    *,
+    windows: Iterable[tuple[Timelike, Timelike]] | None = None,
+    k: int,
+) -> list[dt.time]:
+    """Return a list of `k` random times, with the same arguments as `rand_time`."""
+    index = _time_sampler(start, end, windows)
+    return [_from_microseconds(_draw(index)) for _ in range(k)]
@@ -1,18 +1,98 @@
 from __future__ import annotations
 
-from math import acos, cos, e, exp, fabs, floor, lgamma, log, log2, pi, sin, sqrt, tau
-from operator import index
-from os import urandom
-from pathlib import Path
-from typing import ClassVar
-
-PASSPHRASE_DEFAULT_PATH = Path("/usr/share/dict/words")
+import os
+from array import array
+from bisect import bisect_right
+from fractions import Fraction
+from itertools import accumulate
+from math import (
+    acos,
+    cos,
+    e,
+    exp,
+    expm1,
+    fabs,
+    floor,
+    inf,
+    isclose,
+    isfinite,
+    lgamma,
+    log,
+    log1p,
+    log2,
+    pi,
+    sin,
+    sqrt,
+    tau,
+)
+from operator import index, mul
+from threading import local
+from typing import TYPE_CHECKING, ClassVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Sequence
+    from io import FileIO
+    from pathlib import Path
+    from random import Random
+
+    from typing_extensions import Self
+
+BIT_BUFFER_SIZE = 64
+SQRT2 = sqrt(2.0)
 
 
 class _Cache:
+    # Shared by all threads. Attributes are only ever replaced, never mutated.
+    words: ClassVar[tuple[Path | None, Sequence[str]] | None] = None
+    source: ClassVar[Callable[[int], bytes]] = os.urandom
+    urandom_file: ClassVar[FileIO | None] = None
+
+
+class _ThreadCache(local):
     gauss_next: float | None = None
-    words: ClassVar[list[str]] = []
-    words_path: Path = PASSPHRASE_DEFAULT_PATH
+    # Buffered entropy: the lowest `nbits` bits of `bits` are yet to be used
+    bits = 0
+    nbits = 0
+    # Replaces the entropy source in this thread while in fast mode
+    fast_rng: Random | None = None
+
+
+_thread_cache = _ThreadCache()
+
+
+def _reset_thread_cache() -> None:
+    # A forked child must not reuse the values buffered by its parent
+    _thread_cache.gauss_next = None
+    _thread_cache.nbits = 0
+    if _thread_cache.fast_rng is not None:
+        _thread_cache.fast_rng.seed(os.urandom(32))
+
+
+def _source() -> Callable[[int], bytes]:
+    rng = _thread_cache.fast_rng
+    return _Cache.source if rng is None else rng.randbytes
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_thread_cache)
+
+
+def _rand_bits(k: int) -> int:
+    # Hand out exactly k bits from the calling thread's bit buffer
+    cache = _thread_cache
+    nbits = cache.nbits
+    if k <= nbits:
+        cache.nbits = nbits = nbits - k
+        return (cache.bits >> nbits) & ((1 << k) - 1)
+    if cache.fast_rng is not None:
+        # The fast mode buffer is always empty
+        return cache.fast_rng.getrandbits(k)
+    high = cache.bits & ((1 << nbits) - 1)
+    need = k - nbits
+    nbytes = max((need + 7) // 8, BIT_BUFFER_SIZE)
+    bits = int.from_bytes(_Cache.source(nbytes), "big")
+    cache.bits, cache.nbits = bits, 8 * nbytes - need
+    return (high << need) | (bits >> cache.nbits)
 
 
 def beta_variate(alpha: float, beta: float) -> float:
@@ -22,11 +102,20 @@ def beta_variate(alpha: float, beta: float) -> float:
     Conditions on the parameters are `alpha > 0` and `beta > 0`.
     Returned values range between 0 and 1.
     """
+    return beta_variates(alpha, beta, k=1)[0]
+
+
+def beta_variates(alpha: float, beta: float, *, k: int) -> list[float]:
+    """Return a list of `k` beta random variables (see `beta_variate`)."""
     # This version is due to Janne Sinkkonen, and matches all the std
     # texts (e.g., Knuth Vol 2 Ed 3 pg 134 "the beta distribution").
-    if y := gamma_variate(alpha, 1.0):
-        return y / (y + gamma_variate(beta, 1.0))
-    return 0.0
+    if alpha <= 0.0 or beta <= 0.0:
+        msg = "gamma_variate: alpha and beta must be > 0.0"
+        raise ValueError(msg)
+    return [
+        y / (y + z) if y else 0.0
+        for y, z in zip(_gamma_variates(alpha, k), _gamma_variates(beta, k))
+    ]
 
 
 def binomial_variate(n: int = 1, p: float = 0.5) -> int:
@@ -109,6 +198,162 @@ def binomial_variate(n: int = 1, p: float = 0.5) -> int:
             return k
 
 
+def dirichlet_variate(alphas: Sequence[float]) -> list[float]:
+    """
+    Dirichlet distribution.
+
+    All concentration parameters in `alphas` must be greater than zero.
+    Returns a list of non-negative floats summing to 1.
+    """
+    return dirichlet_variates(alphas, k=1)[0]
+
+
+def dirichlet_variates(alphas: Sequence[float], *, k: int) -> list[list[float]]:
+    """Return a list of `k` Dirichlet random vectors (see `dirichlet_variate`)."""
+    if not alphas:
+        msg = "alphas must not be empty"
+        raise ValueError(msg)
+    if not all(a > 0.0 for a in alphas):
+        msg = "dirichlet_variate: all alphas must be > 0.0"
+        raise ValueError(msg)
+    # Normalized gamma variates, generated one column at a time so that
+    # every alpha's constants are computed once
+    out: list[list[float]] = []
+    while len(out) < k:
+        columns = [_gamma_variates(a, k - len(out)) for a in alphas]
+        # Every component can underflow to zero for tiny alphas; such rows are
+        # drawn again
+        out.extend(
+            [g / total for g in row] for row in zip(*columns) if (total := sum(row))
+        )
+    return out
+
+
+class EmpiricalDistribution:
+    """
+    A continuous distribution given by a piecewise-linear quantile table.
+
+    Build it from observed `samples`, from histogram bins with `from_histogram`,
+    or from a quantile function with `from_ppf`. The table of `table_size`
+    segments is computed once; every variate then takes a single `random()` and
+    a constant-time lookup.
+    """
+
+    def __init__(self, samples: Iterable[float], *, table_size: int = 1024) -> None:
+        data = sorted(map(float, samples))
+        if not data:
+            msg = "samples must not be empty"
+            raise ValueError(msg)
+        _check_table_size(table_size)
+        if len(data) == 1:
+            data.append(data[0])
+        # Linear interpolation between order statistics
+        last = len(data) - 1
+        table = []
+        for i in range(table_size + 1):
+            pos = i * last / table_size
+            j = min(int(pos), last - 1)
+            table.append(data[j] + (pos - j) * (data[j + 1] - data[j]))
+        self._set_table(table)
+
+    @classmethod
+    def from_histogram(
+        cls, edges: Sequence[float], counts: Sequence[float], *, table_size: int = 1024
+    ) -> Self:
+        """
+        Create a distribution from histogram bins. `counts[i]` is the weight of
+        the bin `[edges[i], edges[i + 1])`; values are uniform within each bin.
+        """
+        if len(edges) != len(counts) + 1 or not counts:
+            msg = "edges must have exactly one more element than counts"
+            raise ValueError(msg)
+        if any(a >= b for a, b in zip(edges, edges[1:])):
+            msg = "edges must be strictly increasing"
+            raise ValueError(msg)
+        if any(c < 0.0 for c in counts):
+            msg = "counts must be non-negative"
+            raise ValueError(msg)
+        _check_table_size(table_size)
+        cum = [0.0, *accumulate(counts)]
+        total = cum[-1]
+        if not total > 0.0:
+            msg = "total count must be greater than zero"
+            raise ValueError(msg)
+        last = len(counts) - 1
+        table = []
+        for i in range(table_size + 1):
+            target = i * total / table_size
+            # The bin containing the target, skipping over empty bins
+            j = min(bisect_right(cum, target) - 1, last)
+            while not counts[j]:
+                j -= 1
+            frac = min((target - cum[j]) / counts[j], 1.0)
+            table.append(edges[j] + frac * (edges[j + 1] - edges[j]))
+        return cls._from_table(table)
+
+    @classmethod
+    def from_ppf(
+        cls, func: Callable[[float], float], *, table_size: int = 1024
+    ) -> Self:
+        """
+        Create a distribution from its quantile function (the inverse of its
+        cumulative distribution function), evaluated at `table_size + 1` points.
+        Infinite tails are cut off at the `0.5 / table_size` quantiles.
+        """
+        _check_table_size(table_size)
+        half = 0.5 / table_size
+        table = [
+            _ppf_tail(func, 0.0, half),
+            *(func(i / table_size) for i in range(1, table_size)),
+            _ppf_tail(func, 1.0, 1.0 - half),
+        ]
+        return cls._from_table(table)
+
+    @classmethod
+    def _from_table(cls, table: list[float]) -> Self:
+        self = cls.__new__(cls)
+        self._set_table(table)
+        return self
+
+    def _set_table(self, table: list[float]) -> None:
+        if any(a > b for a, b in zip(table, table[1:])):
+            msg = "quantile function must be non-decreasing"
+            raise ValueError(msg)
+        self._size = len(table) - 1
+        self._base = array("d", table)
+        self._slope = array("d", [b - a for a, b in zip(table, table[1:])])
+
+    def variate(self) -> float:
+        """Return a single random value."""
+        u = random() * self._size
+        i = int(u)
+        return self._base[i] + (u - i) * self._slope[i]
+
+    def variates(self, *, k: int) -> list[float]:
+        """Return a list of `k` random values."""
+        size, base, slope = self._size, self._base, self._slope
+        out = []
+        for _ in range(k):
+            u = random() * size
+            i = int(u)
+            out.append(base[i] + (u - i) * slope[i])
+        return out
+
+
+def _ppf_tail(func: Callable[[float], float], p: float, nudged: float) -> float:
+    try:
+        x = func(p)
+    except (ValueError, ArithmeticError):
+        return func(nudged)
+    return x if isfinite(x) else func(nudged)
+
+
+def _check_table_size(table_size: int) -> None:
+    if table_size < 1:
+        msg = "table size must be positive"
+        raise ValueError(msg)
+
+
 def expo_variate(lambda_: float = 1.0) -> float:
     """
     Exponential distribution.
@@ -122,55 +367,48 @@ def expo_variate(lambda_: float = 1.0) -> float:
     return -log(1.0 - random()) / lambda_
 
 
+def _gamma_variates(alpha: float, k: int) -> list[float]:
+    # Uses G. Marsaglia and W.W. Tsang, "A simple method for generating gamma
+    # variables", ACM Trans. Math. Softw. 26, 3 (2000), p363-372. The squeeze
+    # accepts ~98% of candidates with one normal and one uniform. For alpha < 1,
+    # samples Gamma(alpha + 1) and scales it by U**(1/alpha) (the "boost").
+    boost = alpha < 1.0
+    d = (alpha + 1.0 if boost else alpha) - 1.0 / 3.0
+    c = 1.0 / sqrt(9.0 * d)
+    out: list[float] = []
+    while len(out) < k:
+        x = gauss()
+        v = 1.0 + c * x
+        if v <= 0.0:
+            continue
+        v = v * v * v
+        u = 1.0 - random()
+        x2 = x * x
+        if u < 1.0 - 0.0331 * x2 * x2 or log(u) < 0.5 * x2 + d * (1.0 - v + log(v)):
+            out.append(d * v)
+    if boost:
+        inv = 1.0 / alpha
+        return [g * (1.0 - random()) ** inv for g in out]
+    return out
+
+
 def gamma_variate(alpha: float, beta: float) -> float:
     """
     Gamma distribution.
 
     Conditions on the parameters are `alpha > 0` and `beta > 0`.
     """
+    return gamma_variates(alpha, beta, k=1)[0]
+
+
+def gamma_variates(alpha: float, beta: float, *, k: int) -> list[float]:
+    """Return a list of `k` gamma random variables (see `gamma_variate`)."""
     if alpha <= 0.0 or beta <= 0.0:
         msg = "gamma_variate: alpha and beta must be > 0.0"
         raise ValueError(msg)
-
-    if alpha > 1.0:
-        # Uses R.C.H. Cheng, "The generation of Gamma
-        # variables with non-integral shape parameters",
-        # Applied Statistics, (1977), 26, No. 1, p71-74
-
-        ainv = sqrt(2.0 * alpha - 1.0)
-        b = alpha - log(4)
-        c = alpha + ainv
-        sg = 1.0 + log(4.5)
-
-        while True:
-            u = random()
-            if not 1e-7 < u < 0.9999999:
-                continue  # pragma: no cover
-            u2 = 1.0 - random()
-            v = log(u / (1.0 - u)) / ainv
-            x = alpha * exp(v)
-            z = u * u * u2
-            r = b + c * v - x
-            if r + sg - 4.5 * z >= 0 or r >= log(z):
-                return x * beta
-
-    if alpha == 1.0:
-        # expovariate(1/beta)  # noqa: ERA001
-        return -log(1.0 - random()) * beta
-
-    # alpha is between 0 and 1 (exclusive)
-    # Uses ALGORITHM GS of Statistical Computing - Kennedy & Gentle
-    while True:
-        b = (e + alpha) / e
-        p = b * random()
-        x = p ** (1.0 / alpha) if p <= 1.0 else -log((b - p) / alpha)
-        u = random()
-        if p > 1.0:
-            if u <= x ** (alpha - 1.0):
-                break
-        elif u <= exp(-x):
-            break
-    return x * beta
+    if beta == 1.0:
+        return _gamma_variates(alpha, k)
+    return [g * beta for g in _gamma_variates(alpha, k)]
 
 
 def gauss(mu: float = 0.0, sigma: float = 1.0) -> float:
@@ -179,19 +417,126 @@ def gauss(mu: float = 0.0, sigma: float = 1.0) -> float:
 
     `mu` is the mean, and `sigma` is the standard deviation.
     This is slightly faster than the normal_variate() function.
-
-    Not thread-safe without a lock around calls.
     """
-    z = _Cache.gauss_next
-    _Cache.gauss_next = None
+    cache = _thread_cache
+    z = cache.gauss_next
+    cache.gauss_next = None
     if z is None:
         xtau = random() * tau
         g2rad = sqrt(-2.0 * log(1.0 - random()))
         z = cos(xtau) * g2rad
-        _Cache.gauss_next = sin(xtau) * g2rad
+        cache.gauss_next = sin(xtau) * g2rad
     return mu + z * sigma
 
 
+def geometric_variate(p: float) -> int:
+    """
+    Geometric distribution.
+
+    Gives the number of independent trials needed for the first success,
+    with the probability of success in each trial being p.
+    Returns an integer in the range `[1, +inf)`.
+    """
+    return geometric_variates(p, k=1)[0]
+
+
+def geometric_variates(p: float, *, k: int) -> list[int]:
+    """Return a list of `k` geometric random variables (see `geometric_variate`)."""
+    if p == 1.0:
+        return [1] * k
+    if not (0.0 < p < 1.0):
+        msg = "p must be in range (0, 1]"
+        raise ValueError(msg)
+    # Inversion: a single uniform per variate
+    c = log1p(-p)
+    if c > -1e-306:
+        # For p below ~2e-307, the variate can exceed the largest float
+        d = Fraction(c)
+        return [floor(Fraction(log(1.0 - random())) / d) + 1 for _ in range(k)]
+    return [floor(log(1.0 - random()) / c) + 1 for _ in range(k)]
+
+
+def hypergeometric_variate(ngood: int, nbad: int, nsample: int) -> int:
+    """
+    Hypergeometric distribution.
+
+    Gives the number of good items among `nsample` items drawn without
+    replacement from a population of `ngood` good and `nbad` bad items:
+    ```
+        sample([True, False], nsample, counts=[ngood, nbad]).count(True)
+    ```
+    """
+    return hypergeometric_variates(ngood, nbad, nsample, k=1)[0]
+
+
+def _hypergeometric_hrua(good: int, bad: int, sample: int, k: int) -> list[int]:
+    # HRUA: Ratio-of-uniforms method by Ernst Stadlober
+    # https://doi.org/10.1016/0377-0427(90)90349-5
+    # Assumes good <= bad and sample <= (good + bad) / 2
+    total = good + bad
+    p = good / total
+    a = sample * p + 0.5
+    c = sqrt((total - sample) * sample * p * (1.0 - p) / (total - 1) + 0.5)
+    h = 1.7155277699214135 * c + 0.8989161620588988
+    m = floor((sample + 1) * (good + 1) / (total + 2))
+    g = lgamma(m + 1) + lgamma(good - m + 1)
+    g += lgamma(sample - m + 1) + lgamma(bad - sample + m + 1)
+    b = min(min(sample, good) + 1, floor(a + 16.0 * c))
+
+    out: list[int] = []
+    while len(out) < k:
+        u = 1.0 - random()
+        x = a + h * (random() - 0.5) / u
+        if x < 0.0 or x >= b:
+            continue
+        n = floor(x)
+        t = g - lgamma(n + 1) - lgamma(good - n + 1)
+        t -= lgamma(sample - n + 1) + lgamma(bad - sample + n + 1)
+        # Squeeze tests first, the exact test only if both are inconclusive
+        if u * (4.0 - u) - 3.0 <= t or (u * (u - t) < 1.0 and 2.0 * log(u) <= t):
+            out.append(n)
+    return out
+
+
+def hypergeometric_variates(
+    ngood: int, nbad: int, nsample: int, *, k: int
+) -> list[int]:
+    """
+    Return a list of `k` hypergeometric random variables
+    (see `hypergeometric_variate`).
+    """
+    if ngood < 0 or nbad < 0:
+        msg = "ngood and nbad must be non-negative"
+        raise ValueError(msg)
+    total = ngood + nbad
+    if not 0 <= nsample <= total:
+        msg = "nsample must be in range [0, ngood + nbad]"
+        raise ValueError(msg)
+
+    # Exploit symmetry to establish:  good <= bad, sample <= total / 2
+    good, bad = min(ngood, nbad), max(ngood, nbad)
+    sample = min(nsample, total - nsample)
+
+    if sample < 10:
+        # Direct simulation of the draws, running in time O(sample)
+        out: list[int] = []
+        for _ in range(k):
+            g, t = good, total
+            for _ in range(sample):
+                if random() * t < g:
+                    g -= 1
+                t -= 1
+            out.append(good - g)
+    else:
+        out = _hypergeometric_hrua(good, bad, sample, k)
+
+    if good != ngood:
+        out = [sample - x for x in out]
+    if sample != nsample:
+        out = [ngood - x for x in out]
+    return out
+
+
 def log_norm_variate(mu: float, sigma: float) -> float:
     """
     Log normal distribution.
@@ -203,6 +548,165 @@ def log_norm_variate(mu: float, sigma: float) -> float:
     return exp(normal_variate(mu, sigma))
 
 
+def multinomial(k: int, weights: Sequence[float]) -> list[int]:
+    """
+    Multinomial distribution.
+
+    Gives the number of times each category was chosen in `k` independent trials,
+    with categories chosen proportionally to `weights`. Equivalent to counting
+    the results of `choices(range(len(weights)), weights, k=k)`, but runs in time
+    proportional to the number of categories rather than to `k`.
+    """
+    if k < 0:
+        msg = "k must be non-negative"
+        raise ValueError(msg)
+    if any(w < 0.0 for w in weights):
+        msg = "weights must be non-negative"
+        raise ValueError(msg)
+    # Suffix sums make the last category with a nonzero weight take p = 1.0
+    remaining = list(accumulate(reversed(weights)))[::-1]
+    if not remaining or remaining[0] <= 0.0:
+        msg = "total of weights must be greater than zero"
+        raise ValueError(msg)
+    if not isfinite(remaining[0]):
+        msg = "total of weights must be finite"
+        raise ValueError(msg)
+
+    # Each count is binomial conditional on the trials left for the categories
+    # that have not been drawn yet
+    out: list[int] = []
+    for w, rest in zip(weights, remaining):
+        x = binomial_variate(k, w / rest) if k and w else 0
+        out.append(x)
+        k -= x
+    return out
+
+
+def multivariate_hypergeometric(k: int, counts: Sequence[int]) -> list[int]:
+    """
+    Multivariate hypergeometric distribution.
+
+    Gives the number of items of each category among `k` items drawn without
+    replacement from a population with `counts` items in each category.
+    Equivalent to counting the results of
+    `sample(range(len(counts)), k, counts=counts)`, but runs in time proportional
+    to the number of categories rather than to `k`.
+    """
+    if any(c < 0 for c in counts):
+        msg = "counts must be non-negative"
+        raise ValueError(msg)
+    total = sum(counts)
+    if not 0 <= k <= total:
+        msg = "sample larger than population or is negative"
+        raise ValueError(msg)
+
+    out: list[int] = []
+    for c in counts:
+        total -= c
+        x = hypergeometric_variate(c, total, k) if k else 0
+        out.append(x)
+        k -= x
+    return out
+
+
+def _cholesky(cov: Sequence[Sequence[float]]) -> list[list[float]]:
+    # Cholesky-Banachiewicz decomposition into a lower triangular L with
+    # L @ L.T == cov. Pivots that vanish within rounding error (which happens for
+    # positive semi-definite matrices) get a zero column instead of failing, as
+    # long as the entries they would eliminate vanish too.
+    n = len(cov)
+    tol = 1e-12 * max((fabs(cov[i][i]) for i in range(n)), default=0.0)
+    factor: list[list[float]] = []
+    for i in range(n):
+        row: list[float] = []
+        for j in range(i):
+            pivot = factor[j][j]
+            rest = cov[i][j] - sum(map(mul, row, factor[j]))
+            if pivot:
+                row.append(rest / pivot)
+            elif fabs(rest) > tol:
+                msg = "covariance matrix must be positive semi-definite"
+                raise ValueError(msg)
+            else:
+                row.append(0.0)
+        d = cov[i][i] - sum(map(mul, row, row))
+        if d < -tol:
+            msg = "covariance matrix must be positive semi-definite"
+            raise ValueError(msg)
+        row.append(sqrt(d) if d > tol else 0.0)
+        factor.append(row)
+    return factor
+
+
+class MultivariateNormal:
+    """
+    Multivariate normal distribution.
+
+    `mean` is the mean vector, and `cov` is the covariance matrix, which must be
+    symmetric and positive semi-definite. The covariance matrix is factored once,
+    when the distribution is created.
+    """
+
+    def __init__(self, mean: Sequence[float], cov: Sequence[Sequence[float]]) -> None:
+        n = len(mean)
+        if len(cov) != n or any(len(row) != n for row in cov):
+            msg = "covariance matrix must be square and match the mean"
+            raise ValueError(msg)
+        if not all(
+            isclose(cov[i][j], cov[j][i], rel_tol=1e-9, abs_tol=1e-12)
+            for i in range(n)
+            for j in range(i)
+        ):
+            msg = "covariance matrix must be symmetric"
+            raise ValueError(msg)
+        self.mean = [float(m) for m in mean]
+        self._factor = _cholesky(cov)
+
+    def variate(self) -> list[float]:
+        """Return a single random vector."""
+        z = [gauss() for _ in self.mean]
+        return [m + sum(map(mul, row, z)) for m, row in zip(self.mean, self._factor)]
+
+    def variates(self, *, k: int) -> array[float]:
+        """Return `k` random vectors, concatenated into a single flat array."""
+        n = len(self.mean)
+        pairs = list(zip(self.mean, self._factor))
+        out = array("d")
+        for _ in range(k):
+            z = [gauss() for _ in range(n)]
+            out.extend([m + sum(map(mul, row, z)) for m, row in pairs])
+        return out
+
+
+def negative_binomial_variate(n: float, p: float) -> int:
+    """
+    Negative binomial distribution.
+
+    Gives the number of failures before the `n`-th success in independent trials
+    with the probability of success in each trial being p. `n` must be greater than
+    zero, but does not have to be an integer.
+    """
+    return negative_binomial_variates(n, p, k=1)[0]
+
+
+def negative_binomial_variates(n: float, p: float, *, k: int) -> list[int]:
+    """
+    Return a list of `k` negative binomial random variables
+    (see `negative_binomial_variate`).
+    """
+    if n <= 0.0:
+        msg = "n must be greater than zero"
+        raise ValueError(msg)
+    if p == 1.0:
+        return [0] * k
+    if not (0.0 < p < 1.0):
+        msg = "p must be in range (0, 1]"
+        raise ValueError(msg)
+    # Gamma-Poisson mixture
+    scale = (1.0 - p) / p
+    return [poisson_variate(gamma_variate(n, scale)) for _ in range(k)]
+
+
 def normal_variate(mu: float = 0.0, sigma: float = 1.0) -> float:
     """
     Normal distribution.
@@ -233,9 +737,74 @@ def pareto_variate(alpha: float) -> float:
     return (1.0 - random()) ** (-1.0 / alpha)  # type: ignore[no-any-return]
 
 
+def poisson_variate(lambda_: float) -> int:
+    """
+    Poisson distribution.
+
+    Gives the number of events occurring in a fixed interval if they occur
+    independently at a constant mean rate `lambda_`, which must be non-negative.
+    """
+    return poisson_variates(lambda_, k=1)[0]
+
+
+def poisson_variates(lambda_: float, *, k: int) -> list[int]:
+    """Return a list of `k` Poisson random variables (see `poisson_variate`)."""
+    if lambda_ < 0.0:
+        msg = "lambda_ must be non-negative"
+        raise ValueError(msg)
+    if lambda_ == 0.0:
+        return [0] * k
+
+    out: list[int] = []
+    if lambda_ < 10.0:
+        # Inversion by sequential search, running in time O(lambda_)
+        p0 = exp(-lambda_)
+        for _ in range(k):
+            x = 0
+            p = s = p0
+            u = random()
+            while u > s:
+                x += 1
+                p *= lambda_ / x
+                if p == 0.0:
+                    break  # pragma: no cover
+                s += p
+            out.append(x)
+        return out
+
+    # PTRS: Transformed rejection with squeeze method by Wolfgang Hörmann
+    # https://citeseerx.ist.psu.edu/viewdoc/download?doi=10.1.1.48.3054
+    slam = sqrt(lambda_)
+    loglam = log(lambda_)
+    b = 0.931 + 2.53 * slam
+    a = -0.059 + 0.02483 * b
+    log_inv_alpha = log(1.1239 + 1.1328 / (b - 3.4))
+    vr = 0.9277 - 3.6224 / (b - 2.0)
+
+    while len(out) < k:
+        us = 0.5 - fabs(u := random() - 0.5)
+        v = 1.0 - random()
+        x = floor((2.0 * a / us + b) * u + lambda_ + 0.43)
+
+        # The early-out "squeeze" test substantially reduces
+        # the number of acceptance condition evaluations.
+        if us >= 0.07 and v <= vr:
+            out.append(x)
+            continue
+        if x < 0 or (us < 0.013 and v > us):
+            continue
+
+        # Acceptance-rejection test.
+        if log(v) + log_inv_alpha - log(a / (us * us) + b) <= (
+            -lambda_ + x * loglam - lgamma(x + 1)
+        ):
+            out.append(x)
+    return out
+
+
 def random() -> float:
     """Generate a random number in range [0.0, 1.0)."""
-    return (int.from_bytes(urandom(7), "big") >> 3) * 2**-53
+    return _rand_bits(53) * 2**-53
 
 
 def triangular(low: float = 0.0, high: float = 1.0, mode: float | None = None) -> float:
@@ -257,6 +826,96 @@ def triangular(low: float = 0.0, high: float = 1.0, mode: float | None = None) -
     return low + (high - low) * sqrt(u * c)
 
 
+def _truncated_expo(lambda_: float, low: float, high: float) -> float:
+    # Inverse transform sampling of the density proportional to exp(-lambda_ * x)
+    # on [low, high], in closed form
+    if lambda_ < 0.0:
+        return -_truncated_expo(-lambda_, -high, -low)
+    if lambda_ == 0.0:
+        return low + (high - low) * random()
+    x = low - log1p(random() * expm1(-lambda_ * (high - low))) / lambda_
+    return min(x, high)
+
+
+def truncated_expo_variate(
+    lambda_: float = 1.0, low: float = 0.0, high: float = inf
+) -> float:
+    """
+    Exponential distribution truncated to the range `[low, high]`.
+
+    `lambda_` is the rate, as in `expo_variate`. The bound towards which the
+    density decays may be infinite. Every call takes a single random number.
+    """
+    if not low < high:
+        msg = "low must be less than high"
+        raise ValueError(msg)
+    if (lambda_ >= 0.0 and low == -inf) or (lambda_ <= 0.0 and high == inf):
+        msg = "the range must be bounded where the density does not decay"
+        raise ValueError(msg)
+    return _truncated_expo(lambda_, low, high)
+
+
+def _truncated_normal_rou(a: float, b: float) -> float:
+    # Ratio of uniforms (Kinderman & Monahan, 1977) restricted to [a, b]: x = v/u
+    # with (u, v) uniform in a rectangle is accepted if u <= exp(-x**2 / 4). The
+    # rectangle bounds v by max |x| * exp(-x**2 / 4) over [a, b], peaking at
+    # sqrt(2), so that at least half of the candidates are accepted (~73% for
+    # the whole real line).
+    v_lo = a * exp(-0.25 * a * a) if a > -SQRT2 else -SQRT2 * exp(-0.5)
+    v_hi = b * exp(-0.25 * b * b) if b < SQRT2 else SQRT2 * exp(-0.5)
+    while True:
+        u = 1.0 - random()
+        x = (v_lo + (v_hi - v_lo) * random()) / u
+        if a <= x <= b and x * x <= -4.0 * log(u):
+            return x
+
+
+def _truncated_normal_tail(a: float, b: float) -> float:
+    # Uses C.P. Robert, "Simulation of truncated normal variables", Statistics and
+    # Computing 5 (1995), p121-125, for 0 <= a < b. Proposes from an exponential
+    # with the optimal rate, shifted to a and truncated at b, or from a uniform
+    # if [a, b] is narrower than the exponential's scale, whichever accepts more
+    # candidates. Acceptance rates do not degrade however far out [a, b] is.
+    root = sqrt(a * a + 4.0)
+    alpha = 0.5 * (a + root)
+    if b - a < 2.0 * sqrt(e) / (a + root) * exp(0.25 * (a * a - a * root)):
+        while True:
+            z = a + (b - a) * random()
+            if log(1.0 - random()) <= 0.5 * (a * a - z * z):
+                return z
+    while True:
+        z = _truncated_expo(alpha, a, b)
+        if log(1.0 - random()) <= -0.5 * (z - alpha) ** 2:
+            return z
+
+
+def truncated_normal_variate(
+    mu: float = 0.0, sigma: float = 1.0, low: float = -inf, high: float = inf
+) -> float:
+    """
+    Normal distribution truncated to the range `[low, high]`.
+
+    `mu` is the mean and `sigma` is the standard deviation of the untruncated
+    distribution. Either bound may be infinite. The expected cost is constant,
+    however far from `mu` the range is.
+    """
+    if not sigma > 0.0:
+        msg = "truncated_normal_variate: sigma must be > 0.0"
+        raise ValueError(msg)
+    if not low < high:
+        msg = "low must be less than high"
+        raise ValueError(msg)
+    a = (low - mu) / sigma
+    b = (high - mu) / sigma
+    if a < 0.0 < b:
+        z = _truncated_normal_rou(a, b)
+    elif a >= 0.0:
+        z = _truncated_normal_tail(a, b)
+    else:
+        z = -_truncated_normal_tail(-b, -a)
+    return min(max(mu + sigma * z, low), high)
+
+
 def uniform(a: float, b: float) -> float:
     """Generates a random number in range `[a, b)` or `[a, b]` depending on rounding."""
     return a + (b - a) * random()
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import os
+from contextlib import contextmanager
+from hashlib import shake_128
+from random import Random
+from threading import local
+from typing import TYPE_CHECKING
+from weakref import WeakSet
+
+from .distributions import _Cache, _reset_thread_cache, _thread_cache
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+KEY_SIZE = 32
+
+_instances: WeakSet[DRBG] = WeakSet()
+
+
+class _ThreadState(local):
+    key = b""
+    block = b""
+    pos = 0
+    generated = 0
+
+
+class DRBG:
+    """
+    A deterministic random bit generator seeded from `urandom`.
+
+    Keystream is produced in blocks of `block_size` bytes by SHAKE128. The key is
+    replaced after every block, so a leaked state does not reveal earlier blocks.
+    Every thread uses its own independently seeded stream, so no locking is needed.
+    Streams reseed themselves from `urandom` every `reseed_interval` bytes and in
+    child processes after a `fork`.
+    """
+
+    def __init__(
+        self, *, block_size: int = 1 << 16, reseed_interval: int = 1 << 30
+    ) -> None:
+        if block_size < 1:
+            msg = "block size must be positive"
+            raise ValueError(msg)
+        if reseed_interval < block_size:
+            msg = "reseed interval must be at least the block size"
+            raise ValueError(msg)
+        self.block_size = block_size
+        self.reseed_interval = reseed_interval
+        self._state = _ThreadState()
+        _instances.add(self)
+
+    @staticmethod
+    def _reseed(state: _ThreadState) -> None:
+        state.key = shake_128(state.key + os.urandom(KEY_SIZE)).digest(KEY_SIZE)
+        state.block = b""
+        state.pos = 0
+        state.generated = 0
+
+    def _next_block(self, state: _ThreadState, n: int) -> bytes:
+        if not state.key or state.generated >= self.reseed_interval:
+            self._reseed(state)
+        out = shake_128(state.key).digest(KEY_SIZE + n)
+        state.key = out[:KEY_SIZE]
+        state.generated += n
+        return out[KEY_SIZE:]
+
+    def rand_bytes(self, n: int) -> bytes:
+        """Generate `n` random bytes."""
+        if n < 0:
+            msg = "negative argument not allowed"
+            raise ValueError(msg)
+        state = self._state
+        pos = state.pos
+        end = pos + n
+        if end <= len(state.block):
+            state.pos = end
+            return state.block[pos:end]
+        if n >= self.block_size:
+            return self._next_block(state, n)
+        state.block = self._next_block(state, self.block_size)
+        state.pos = n
+        return state.block[:n]
+
+    def reseed(self) -> None:
+        """
+        Mix fresh `urandom` output into the calling thread's key and discard its
+        buffered output.
+        """
+        self._reseed(self._state)
+
+
+def _reseed_all() -> None:
+    for drbg in _instances:
+        # Every stream will be seeded again on first use
+        drbg._state = _ThreadState()  # noqa: SLF001
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reseed_all)
+
+
+def use_drbg(drbg: DRBG | None = None) -> DRBG:
+    """
+    Make ixia draw entropy from a DRBG instead of calling `urandom` directly.
+    Creates a new DRBG if none is given. Returns the DRBG in use.
+    """
+    if drbg is None:
+        drbg = DRBG()
+    _Cache.source = drbg.rand_bytes
+    return drbg
+
+
+def use_urandom() -> None:
+    """Make ixia draw entropy directly from `urandom` (the default)."""
+    _Cache.source = os.urandom
+
+
+@contextmanager
+def fast_mode() -> Iterator[None]:
+    """
+    Make ixia draw entropy from a fast, non-cryptographic generator (Mersenne
+    Twister seeded from `urandom`) in the calling thread, within a `with` block.
+    Functions returning raw random data or secrets raise `RuntimeError` meanwhile.
+    """
+    previous = _thread_cache.fast_rng
+    # Values buffered from one generator must never be handed out by the other
+    _reset_thread_cache()
+    _thread_cache.fast_rng = Random(os.urandom(KEY_SIZE))  # noqa: S311
+    try:
+        yield
+    finally:
+        _thread_cache.fast_rng = previous
+        _reset_thread_cache()
@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import sys
+from array import array
+from contextlib import ExitStack
+from math import ceil
+from pathlib import Path
+from tempfile import TemporaryDirectory, mkstemp
+from typing import TYPE_CHECKING, Any, BinaryIO
+
+from .sequences import shuffle
+from .strings import _rand_bytes, _rand_into
+
+if TYPE_CHECKING:
+    from io import FileIO
+    from os import PathLike
+
+    from .parallel import Typecode
+
+IO_BUFFER_SIZE = 1 << 20
+MIN_BUCKET_BUFFER_SIZE = 1 << 12
+MAX_BUCKETS = 256
+WRITE_CHUNK_SIZE = 1 << 20
+NPY_DESCR = {"B": "|u1", "d": "<f8", "q": "<i8"}
+INT64_MIN = -(1 << 63)
+INT64_MAX = (1 << 63) - 1
+
+
+def shuffle_file(
+    src: PathLike[str] | str,
+    dst: PathLike[str] | str,
+    *,
+    memory_limit: int = 1 << 30,
+    tmp_dir: PathLike[str] | str | None = None,
+) -> None:
+    """
+    Write the lines of the file `src` to the file `dst` in random order.
+
+    Files larger than half of `memory_limit` (in bytes) are shuffled out of core:
+    lines are scattered into random temporary buckets in `tmp_dir`, and every
+    bucket is then shuffled in memory and appended to `dst`. A single line must
+    fit in memory.
+
+    `src` and `dst` may be the same file: the output is then written next to it
+    and replaces it once complete.
+    """
+    if memory_limit < 1:
+        msg = "memory limit must be positive"
+        raise ValueError(msg)
+    # In-memory lists of lines take up roughly twice the size of their content
+    budget = max(memory_limit // 2, 1)
+    src, dst = Path(src), Path(dst)
+    if not (dst.exists() and src.samefile(dst)):
+        with ExitStack() as stack:
+            tmp = stack.enter_context(TemporaryDirectory(dir=tmp_dir))
+            out = stack.enter_context(dst.open("wb", buffering=IO_BUFFER_SIZE))
+            _shuffle_into(src, out, budget, Path(tmp))
+        return
+
+    # Opening dst for writing would truncate src before it is read
+    fd, name = mkstemp(dir=dst.parent, prefix=f".{dst.name}.")
+    partial = Path(name)
+    try:
+        with ExitStack() as stack:
+            tmp = stack.enter_context(TemporaryDirectory(dir=tmp_dir))
+            out = stack.enter_context(
+                open(fd, "wb", buffering=IO_BUFFER_SIZE)  # noqa: PTH123
+            )
+            _shuffle_into(src, out, budget, Path(tmp))
+        partial.replace(dst)
+    except BaseException:
+        partial.unlink(missing_ok=True)
+        raise
+
+
+def _shuffle_into(src: Path, out: BinaryIO, budget: int, tmp: Path) -> None:
+    size = src.stat().st_size
+    if size <= budget:
+        with src.open("rb") as f:
+            lines = f.readlines()
+        if lines and not lines[-1].endswith(b"\n"):
+            # Keep the last line from merging with the line written after it
+            lines[-1] += b"\n"
+        shuffle(lines)
+        out.writelines(lines)
+        return
+
+    # Splitting lines between random buckets and shuffling every bucket yields a
+    # uniformly random permutation (Rao, 1961; Sandelius, 1962). Buckets that
+    # are still too large are split again. The number of buckets is a power of
+    # two, so that every random byte picks a bucket without bias.
+    nbuckets = min(1 << (ceil(size / budget) - 1).bit_length(), MAX_BUCKETS)
+    mask = nbuckets - 1
+    buffer_size = max(min(IO_BUFFER_SIZE, budget // nbuckets), MIN_BUCKET_BUFFER_SIZE)
+    with TemporaryDirectory(dir=tmp) as bucket_dir:
+        paths = [Path(bucket_dir, str(i)) for i in range(nbuckets)]
+        with ExitStack() as stack, src.open("rb") as f:
+            buckets = [
+                stack.enter_context(path.open("wb", buffering=buffer_size))
+                for path in paths
+            ]
+            while lines := f.readlines(IO_BUFFER_SIZE):
+                if not lines[-1].endswith(b"\n"):
+                    lines[-1] += b"\n"
+                for line, r in zip(lines, _rand_bytes(len(lines))):
+                    buckets[r & mask].write(line)
+        for path in paths:
+            # A single line larger than the budget cannot be split any further
+            bucket_budget = budget if path.stat().st_size < size else size
+            _shuffle_into(path, out, bucket_budget, tmp)
+            path.unlink()
+
+
+def _npy_header(typecode: Typecode, size: int) -> bytes:
+    # Format version 1.0, padded so that the data starts at a multiple of 64
+    header = f"{{'descr': '{NPY_DESCR[typecode]}', 'fortran_order': False, "
+    header += f"'shape': ({size},), }}"
+    header += " " * (-(len(header) + 11) % 64) + "\n"
+    return b"\x93NUMPY\x01\x00" + len(header).to_bytes(2, "little") + header.encode()
+
+
+def _write_all(f: FileIO, data: memoryview) -> None:
+    # Raw writes may be partial
+    while data:
+        data = data[f.write(data) or 0 :]
+
+
+def _fill_typed(
+    buf: array[Any], raw: array[int], typecode: Typecode, bounds: tuple[int, int]
+) -> None:
+    # Convert random 64-bit words into the requested items, in place
+    n = len(buf)
+    if typecode == "d":
+        _rand_into(raw)
+        buf[:] = array("d", [(x >> 11) * 2**-53 for x in raw])
+        return
+    a, b = bounds
+    span = b - a + 1
+    shift = 64 - (span - 1).bit_length()
+    values: list[int] = []
+    while len(values) < n:
+        _rand_into(raw)
+        # Rejection sampling on the top bits of every word
+        values.extend(a + r for x in raw if (r := x >> shift) < span)
+    buf[:] = array("q", values[:n])
+
+
+def write_random(  # noqa: PLR0913
+    file: PathLike[str] | str | int,
+    size: int,
+    *,
+    typecode: Typecode = "B",
+    bounds: tuple[int, int] | None = None,
+    npy: bool = False,
+    chunk: int = WRITE_CHUNK_SIZE,
+) -> int:
+    """
+    Write `size` random items to a file, given as a path or a file descriptor.
+    Return the number of bytes written.
+
+    Writes bytes by default. With `typecode="d"`, writes floats in range
+    [0.0, 1.0); with `typecode="q"`, writes signed 64-bit integers, limited to the
+    inclusive range `bounds` if given. Items are little-endian and are preceded by
+    a `.npy` header if `npy` is true. Data is generated into one reused buffer of
+    `chunk` bytes.
+    """
+    if size < 0:
+        msg = "size must be non-negative"
+        raise ValueError(msg)
+    if chunk < 1:
+        msg = "chunk size must be positive"
+        raise ValueError(msg)
+    if typecode not in NPY_DESCR:
+        msg = f"unsupported typecode {typecode!r}, expected 'B', 'd' or 'q'"
+        raise ValueError(msg)
+    if bounds is not None:
+        if typecode != "q":
+            msg = "bounds are only supported for typecode 'q'"
+            raise ValueError(msg)
+        if bounds[0] > bounds[1]:
+            msg = "empty range for bounds"
+            raise ValueError(msg)
+        if bounds[0] < INT64_MIN or bounds[1] > INT64_MAX:
+            msg = "bounds must fit in a signed 64-bit integer"
+            raise OverflowError(msg)
+
+    itemsize = array(typecode).itemsize
+    items_per_chunk = max(min(chunk // itemsize, size), 1)
+    buf = array(typecode, bytes(items_per_chunk * itemsize))
+    # Every byte pattern is a valid item, unless the items are floats or bounded
+    typed = typecode == "d" or bounds is not None
+    raw = array("Q", bytes(len(buf) * 8)) if typed else buf
+    view = memoryview(buf).cast("B")
+    written = 0
+    with open(file, "wb", buffering=0, closefd=not isinstance(file, int)) as f:
+        if npy:
+            header = _npy_header(typecode, size)
+            _write_all(f, memoryview(header))
+            written += len(header)
+        remaining = size
+        while remaining:
+            n = min(remaining, items_per_chunk)
+            if typed:
+                _fill_typed(buf, raw, typecode, bounds or (INT64_MIN, INT64_MAX))
+            else:
+                _rand_into(buf)
+            if sys.byteorder == "big" and typed:
+                buf.byteswap()
+            _write_all(f, view[: n * itemsize])
+            written += n * itemsize
+            remaining -= n
+    return written
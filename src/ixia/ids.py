@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import os
+import time
+from base64 import b32encode
+from threading import Lock
+from uuid import UUID
+
+from .distributions import _source
+
+CROCKFORD_BASE32 = bytes.maketrans(
+    b"ABCDEFGHIJKLMNOPQRSTUVWXYZ234567", b"0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+)
+MAX_TIMESTAMP = (1 << 48) - 1
+
+
+class _MonotonicState:
+    # Per-millisecond counter shared by all IDs of one kind. A new millisecond
+    # starts from a random value with its top bit cleared (leaving room for
+    # increments), and every following ID in the same millisecond adds a random
+    # increment in [1, 2**32].
+
+    def __init__(self, bits: int) -> None:
+        self.bits = bits
+        self.lock = Lock()
+        self.ms = -1
+        self.counter = 0
+
+    def reset(self) -> None:
+        self.lock = Lock()
+        self.ms = -1
+
+    def next(self, k: int) -> list[tuple[int, int]]:
+        nbytes = (self.bits + 7) // 8
+        data = _source()(k * nbytes)
+        fresh_mask = (1 << (self.bits - 1)) - 1
+        limit = 1 << self.bits
+        out: list[tuple[int, int]] = []
+        now = time.time_ns() // 1_000_000
+        with self.lock:
+            ms, counter = self.ms, self.counter
+            for i in range(0, k * nbytes, nbytes):
+                r = int.from_bytes(data[i : i + nbytes], "big")
+                if now > ms:
+                    ms, counter = now, r & fresh_mask
+                else:
+                    # Same millisecond (or the clock went backwards)
+                    counter += (r & 0xFFFFFFFF) + 1
+                    if counter >= limit:
+                        ms, counter = ms + 1, r & fresh_mask
+                if ms > MAX_TIMESTAMP:
+                    msg = "timestamp does not fit in 48 bits"
+                    raise OverflowError(msg)
+                out.append((ms, counter))
+            self.ms, self.counter = ms, counter
+        return out
+
+
+_uuid7_state = _MonotonicState(74)
+_ulid_state = _MonotonicState(80)
+
+
+def _reset_states() -> None:
+    _uuid7_state.reset()
+    _ulid_state.reset()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_states)
+
+
+def rand_uuid7() -> UUID:
+    """
+    Return a time-ordered RFC 9562 UUIDv7. UUIDs generated by one process are
+    strictly increasing.
+    """
+    return rand_uuid7s(k=1)[0]
+
+
+def rand_uuid7s(*, k: int) -> list[UUID]:
+    """Return a list of `k` strictly increasing UUIDv7s, reading the clock once."""
+    return [
+        UUID(
+            int=ms << 80
+            | 0x7 << 76
+            | (counter >> 62) << 64
+            | 0b10 << 62
+            | (counter & 0x3FFFFFFFFFFFFFFF)
+        )
+        for ms, counter in _uuid7_state.next(k)
+    ]
+
+
+def rand_ulid() -> str:
+    """
+    Return a time-ordered ULID. ULIDs generated by one process are strictly
+    increasing.
+    """
+    return rand_ulids(k=1)[0]
+
+
+def rand_ulids(*, k: int) -> list[str]:
+    """Return a list of `k` strictly increasing ULIDs, reading the clock once."""
+    # Each 128-bit ULID is placed at the top of a 160-bit block, after two zero
+    # bits, so that the whole batch can be Base32-encoded in one pass and every
+    # ULID takes up the first 26 characters of a 32-character group.
+    blob = b"".join(
+        ((ms << 80 | counter) << 30).to_bytes(20, "big")
+        for ms, counter in _ulid_state.next(k)
+    )
+    text = b32encode(blob).translate(CROCKFORD_BASE32).decode("ascii")
+    return [text[i : i + 26] for i in range(0, len(text), 32)]
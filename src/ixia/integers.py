@@ -1,15 +1,47 @@
 from __future__ import annotations
 
-import secrets
 from math import factorial
-from os import urandom
 
-from .distributions import random
+from .distributions import _rand_bits
+
+
+def _bernoulli(num: int, exp: int) -> bool:
+    # Compare random bits with the binary expansion of p = num / 2**exp until they
+    # differ, using 2 bits on average (Knuth & Yao)
+    for i in reversed(range(exp)):
+        bit = num >> i & 1
+        if _rand_bits(1) != bit:
+            return bool(bit)
+    return False
 
 
 def rand_below(n: int) -> int:
     """Return a random int in the range `[0, n)`."""
-    return secrets.randbelow(n)
+    if n <= 0:
+        msg = "upper bound must be positive"
+        raise ValueError(msg)
+    if n & (n - 1) == 0:
+        return _rand_bits(n.bit_length() - 1)
+    # Fast Dice Roller by Jérémie Lumbroso, using log2(n) + O(1) bits on average
+    # https://arxiv.org/abs/1304.1916
+    # Rather than one bit per step, every round takes at once all the bits that
+    # the doubling steps consume until v reaches n again, i.e. j bits with
+    # v * 2**j >= n > v * 2**(j - 1). The first round is plain rejection.
+    k = (n - 1).bit_length()
+    c = _rand_bits(k)
+    if c < n:
+        return c
+    # Keep the surplus outcomes as a smaller uniform range [0, v)
+    v = (1 << k) - n
+    c -= n
+    while True:
+        j = ((n - 1) // v).bit_length()
+        v <<= j
+        c = c << j | _rand_bits(j)
+        if c < n:
+            return c
+        v -= n
+        c -= n
 
 
 def rand_bits(k: int) -> int:
@@ -17,14 +49,40 @@ def rand_bits(k: int) -> int:
     if k < 0:
         msg = "number of bits must be non-negative"
         raise ValueError(msg)
-    numbytes = (k + 7) // 8
-    x = int.from_bytes(urandom(numbytes), "big")
-    return x >> (numbytes * 8 - k)
+    return _rand_bits(k)
 
 
 def rand_bool(p: float = 0.5) -> bool:
     """Return a random bool with a probability `p` of being true (0.5 by default)."""
-    return random() < p
+    if p == 0.5:
+        return bool(_rand_bits(1))
+    if not p > 0.0:
+        return False
+    if p >= 1.0:
+        return True
+    # Any real p is rounded to a float, whose denominator is a power of two
+    num, den = float(p).as_integer_ratio()
+    return _bernoulli(num, den.bit_length() - 1)
+
+
+def rand_bools(k: int, p: float = 0.5) -> int:
+    """
+    Return `k` random bools packed into the bits of an int, each with a probability
+    `p` of being set (0.5 by default).
+    """
+    if k < 0:
+        msg = "number of bools must be non-negative"
+        raise ValueError(msg)
+    if p == 0.5:
+        return _rand_bits(k)
+    if not p > 0.0:
+        return 0
+    if p >= 1.0:
+        return (1 << k) - 1
+    # Any real p is rounded to a float, whose denominator is a power of two
+    num, den = float(p).as_integer_ratio()
+    exp = den.bit_length() - 1
+    return int("0" + "".join("01"[_bernoulli(num, exp)] for _ in range(k)), 2)
 
 
 def rand_int(a: int, b: int) -> int:
@@ -44,14 +102,14 @@ def rand_range(start: int, stop: int | None = None, step: int = 1) -> int:
             msg = "missing a non-None stop argument"
             raise TypeError(msg)
         if start > 0:
-            return secrets.randbelow(start)
+            return rand_below(start)
         msg = "empty range for rand_range"
         raise ValueError(msg)
 
     width = stop - start
     if step == 1:
         if width > 0:
-            return start + secrets.randbelow(width)
+            return start + rand_below(width)
         msg = f"empty range for rand_range ({start}, {stop}, {step})"
         raise ValueError(msg)
 
@@ -65,7 +123,7 @@ def rand_range(start: int, stop: int | None = None, step: int = 1) -> int:
     if n <= 0:
         msg = "empty range for rand_range"
         raise ValueError(msg)
-    return start + step * secrets.randbelow(n)
+    return start + step * rand_below(n)
 
 
 def universe_rand() -> int:
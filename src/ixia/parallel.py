@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import sys
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from os import cpu_count
+from typing import TYPE_CHECKING, Any, Callable, Literal, cast
+
+from .distributions import _Cache
+from .distributions import random as _random
+from .drbg import DRBG, use_drbg
+from .integers import rand_int
+from .strings import rand_bytes as _rand_bytes
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+    from typing_extensions import Self
+
+Typecode = Literal["B", "d", "q"]
+
+CHUNK_SIZE = 1 << 16
+INT64_MIN = -(1 << 63)
+INT64_MAX = (1 << 63) - 1
+
+
+class SharedArray:
+    """
+    An array of random values written to shared memory by worker processes.
+
+    Use it as a context manager (or call `close()`) to release the shared memory.
+    """
+
+    def __init__(self, typecode: Typecode, length: int) -> None:
+        size = length * array(typecode).itemsize
+        self._shm = SharedMemory(create=True, size=max(size, 1))
+        self.name = self._shm.name
+        self.typecode = typecode
+        self.values = _view(self._shm, typecode, length)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release the view and free the shared memory block."""
+        self.values.release()
+        self._shm.close()
+        self._shm.unlink()
+
+    def tolist(self) -> list[Any]:
+        """Return the values as a list."""
+        return self.values.tolist()
+
+
+def _view(shm: SharedMemory, typecode: Typecode, length: int) -> memoryview[Any]:
+    buf = cast("memoryview[int]", shm.buf)
+    return buf[: length * array(typecode).itemsize].cast(typecode)
+
+
+def _attach(name: str) -> SharedMemory:
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name, track=False)
+    return SharedMemory(name)
+
+
+def _init_worker(fresh_drbg: bool) -> None:  # noqa: FBT001
+    # Give each worker its own DRBG rather than a reseeded copy of the parent's
+    if fresh_drbg:
+        use_drbg()
+
+
+def _fill(
+    name: str,
+    typecode: Typecode,
+    bounds: tuple[int, int],
+    func: Callable[..., Any] | None,
+    args: tuple[Any, ...],
+) -> None:
+    start, stop = bounds
+    shm = _attach(name)
+    view = _view(shm, typecode, stop)
+    try:
+        for lo in range(start, stop, CHUNK_SIZE):
+            hi = min(lo + CHUNK_SIZE, stop)
+            if func is None:
+                view[lo:hi] = _rand_bytes(hi - lo)
+            else:
+                view[lo:hi] = array(typecode, [func(*args) for _ in range(hi - lo)])
+    finally:
+        view.release()
+        shm.close()
+
+
+def _generate(
+    typecode: Typecode,
+    k: int,
+    func: Callable[..., Any] | None,
+    args: tuple[Any, ...],
+    processes: int | None,
+) -> SharedArray:
+    if k < 0:
+        msg = "k must be non-negative"
+        raise ValueError(msg)
+    if processes is None:
+        processes = cpu_count() or 1
+    elif processes < 1:
+        msg = "number of processes must be positive"
+        raise ValueError(msg)
+
+    out = SharedArray(typecode, k)
+    bounds = [k * i // processes for i in range(processes + 1)]
+    fresh_drbg = isinstance(getattr(_Cache.source, "__self__", None), DRBG)
+    try:
+        with ProcessPoolExecutor(
+            processes, initializer=_init_worker, initargs=(fresh_drbg,)
+        ) as pool:
+            futures = [
+                pool.submit(_fill, out.name, typecode, (lo, hi), func, args)
+                for lo, hi in zip(bounds, bounds[1:])
+                if lo < hi
+            ]
+            for future in futures:
+                future.result()
+    except BaseException:
+        out.close()
+        raise
+    return out
+
+
+def random(k: int, *, processes: int | None = None) -> SharedArray:
+    """Generate `k` random floats in range [0.0, 1.0) across a process pool."""
+    return _generate("d", k, _random, (), processes)
+
+
+def rand_ints(a: int, b: int, *, k: int, processes: int | None = None) -> SharedArray:
+    """
+    Generate `k` random integers in range `[a, b]` across a process pool.
+    Both end points must fit in a signed 64-bit integer.
+    """
+    if a < INT64_MIN or b > INT64_MAX:
+        msg = "bounds must fit in a signed 64-bit integer"
+        raise OverflowError(msg)
+    return _generate("q", k, rand_int, (a, b), processes)
+
+
+def variates(
+    func: Callable[..., float],
+    *args: float,
+    k: int,
+    processes: int | None = None,
+) -> SharedArray:
+    """
+    Generate `k` values of `func(*args)` across a process pool,
+    e.g. `variates(ixia.gauss, 0.0, 1.0, k=10**9)`.
+    `func` must be picklable (a module-level function).
+    """
+    return _generate("d", k, func, args, processes)
+
+
+def rand_bytes(n: int, *, processes: int | None = None) -> SharedArray:
+    """Generate `n` random bytes across a process pool."""
+    return _generate("B", n, None, (), processes)
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import csv
+import json
+from typing import TYPE_CHECKING, Any, Callable
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping, Sequence
+    from typing import TextIO
+
+    from typing_extensions import Self
+
+    Schema = Mapping[str, Callable[[int], Sequence[Any]]]
+
+GROUP_SIZE = 1 << 16
+
+
+class Column:
+    """
+    A column spec calling a batch generator, such as `ixia.rand_ints` or
+    `ixia.choices`, as `func(*args, k=k, **kwargs)` to produce `k` values at once.
+
+    Use `Column.each` for generators that return a single value per call.
+    """
+
+    def __init__(
+        self, func: Callable[..., Sequence[Any]], *args: Any, **kwargs: Any
+    ) -> None:
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+
+    @classmethod
+    def each(cls, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Self:
+        """Create a column spec calling `func(*args, **kwargs)` once per value."""
+
+        def batch(*, k: int) -> list[Any]:
+            return [func(*args, **kwargs) for _ in range(k)]
+
+        return cls(batch)
+
+    def __call__(self, k: int) -> Sequence[Any]:
+        """Return `k` values."""
+        return self.func(*self.args, k=k, **self.kwargs)
+
+
+def row_groups(
+    schema: Schema, k: int, *, group_size: int = GROUP_SIZE
+) -> Iterator[dict[str, Sequence[Any]]]:
+    """
+    Generate `k` records in groups of up to `group_size` rows. Every group maps
+    the column names of `schema` to their values, generated one column at a time.
+
+    A schema maps column names to column specs: callables taking a number of
+    values and returning that many values, e.g. a `Column`.
+    """
+    if k < 0:
+        msg = "k must be non-negative"
+        raise ValueError(msg)
+    if group_size < 1:
+        msg = "group size must be positive"
+        raise ValueError(msg)
+    return _row_groups(schema, k, group_size)
+
+
+def _row_groups(
+    schema: Schema, k: int, group_size: int
+) -> Iterator[dict[str, Sequence[Any]]]:
+    for start in range(0, k, group_size):
+        n = min(group_size, k - start)
+        group = {name: spec(n) for name, spec in schema.items()}
+        for name, values in group.items():
+            if len(values) != n:
+                msg = f"column {name!r} returned {len(values)} values instead of {n}"
+                raise ValueError(msg)
+        yield group
+
+
+def columns(schema: Schema, k: int) -> dict[str, Sequence[Any]]:
+    """Generate `k` records as a mapping of column names to their values."""
+    empty: dict[str, Sequence[Any]] = {name: [] for name in schema}
+    return next(row_groups(schema, k, group_size=max(k, 1)), empty)
+
+
+def write_csv(
+    file: TextIO,
+    schema: Schema,
+    k: int,
+    *,
+    header: bool = True,
+    group_size: int = GROUP_SIZE,
+) -> None:
+    """
+    Write `k` records to a CSV file opened with `newline=""`, generating at most
+    `group_size` rows at a time.
+    """
+    writer = csv.writer(file)
+    if header:
+        writer.writerow(schema)
+    for group in row_groups(schema, k, group_size=group_size):
+        writer.writerows(zip(*group.values()))
+
+
+def write_jsonl(
+    file: TextIO, schema: Schema, k: int, *, group_size: int = GROUP_SIZE
+) -> None:
+    """
+    Write `k` records to a file as JSON lines, generating at most `group_size`
+    rows at a time. Values that are not JSON serializable (like dates) are
+    written as strings.
+    """
+    encode = json.JSONEncoder(default=str).encode
+    names = list(schema)
+    for group in row_groups(schema, k, group_size=group_size):
+        file.writelines(
+            encode(dict(zip(names, row))) + "\n" for row in zip(*group.values())
+        )
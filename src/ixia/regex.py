@@ -0,0 +1,282 @@
+from __future__ import annotations
+
+import re
+import string
+import sys
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+from .integers import rand_below
+from .strings import _rand_bytes
+
+if sys.version_info >= (3, 11):
+    import re._parser as sre_parse
+else:
+    import sre_parse
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+PRINTABLE_CHARSET = "".join(map(chr, range(32, 127)))
+MAX_REPEAT = 10
+_CATEGORIES = {
+    sre_parse.CATEGORY_DIGIT: string.digits,
+    sre_parse.CATEGORY_SPACE: " \t\n\r\f\v",
+    sre_parse.CATEGORY_WORD: string.ascii_letters + string.digits + "_",
+}
+_NEGATED_CATEGORIES = {
+    sre_parse.CATEGORY_NOT_DIGIT: sre_parse.CATEGORY_DIGIT,
+    sre_parse.CATEGORY_NOT_SPACE: sre_parse.CATEGORY_SPACE,
+    sre_parse.CATEGORY_NOT_WORD: sre_parse.CATEGORY_WORD,
+}
+_START_ANCHORS = {sre_parse.AT_BEGINNING, sre_parse.AT_BEGINNING_STRING}
+_END_ANCHORS = {sre_parse.AT_END, sre_parse.AT_END_STRING}
+# Atomic groups and possessive quantifiers only exist since Python 3.11, and
+# generate the same strings as their plain counterparts
+_GROUPS = {sre_parse.SUBPATTERN, getattr(sre_parse, "ATOMIC_GROUP", None)}
+_REPEATS = {
+    sre_parse.MAX_REPEAT,
+    sre_parse.MIN_REPEAT,
+    getattr(sre_parse, "POSSESSIVE_REPEAT", None),
+}
+
+
+def _below(n: int, k: int) -> list[int]:
+    # Draw k ints in range [0, n) by rejection sampling on the bytes (or byte
+    # pairs) of a single entropy buffer per round
+    if n == 1:
+        return [0] * k
+    width = 1 if n <= 1 << 8 else 2
+    space = 1 << (8 * width)
+    if n > space:
+        # Character classes this large are rare, fall back to one int at a time
+        return [rand_below(n) for _ in range(k)]
+    limit = space - space % n
+    out: list[int] = []
+    while len(out) < k:
+        # Request enough for the missing values on average, plus some slack
+        need = (k - len(out)) * space // limit + 8
+        data = memoryview(_rand_bytes(need * width))
+        values = data if width == 1 else data.cast("H")
+        out.extend(v % n for v in values if v < limit)
+    del out[k:]
+    return out
+
+
+class _Node(ABC):
+    @abstractmethod
+    def generate(self, k: int) -> list[str]:
+        """Return `k` random strings matching the node."""
+
+
+class _Literal(_Node):
+    def __init__(self, text: str) -> None:
+        self.text = text
+
+    def generate(self, k: int) -> list[str]:
+        return [self.text] * k
+
+
+class _Chars(_Node):
+    def __init__(self, charset: str) -> None:
+        self.charset = charset
+
+    def generate(self, k: int) -> list[str]:
+        charset = self.charset
+        return [charset[i] for i in _below(len(charset), k)]
+
+
+class _Sequence(_Node):
+    def __init__(self, nodes: Sequence[_Node]) -> None:
+        self.nodes = nodes
+
+    def generate(self, k: int) -> list[str]:
+        # Generate every part of all k strings at once, then glue them
+        return list(map("".join, zip(*(node.generate(k) for node in self.nodes))))
+
+
+class _Branch(_Node):
+    def __init__(self, nodes: Sequence[_Node]) -> None:
+        self.nodes = nodes
+
+    def generate(self, k: int) -> list[str]:
+        picks = _below(len(self.nodes), k)
+        outputs = [
+            iter(node.generate(picks.count(i))) for i, node in enumerate(self.nodes)
+        ]
+        return [next(outputs[i]) for i in picks]
+
+
+class _Repeat(_Node):
+    def __init__(self, node: _Node, low: int, high: int) -> None:
+        self.node = node
+        self.low = low
+        self.high = high
+
+    def generate(self, k: int) -> list[str]:
+        low = self.low
+        if low == self.high:
+            counts = [low] * k
+        else:
+            counts = [low + c for c in _below(self.high - low + 1, k)]
+        # Generate all repetitions of all k strings at once, then group them
+        parts = self.node.generate(sum(counts))
+        out: list[str] = []
+        pos = 0
+        for count in counts:
+            out.append("".join(parts[pos : pos + count]))
+            pos += count
+        return out
+
+
+def _casefold(chars: str, flags: int) -> str:
+    if flags & re.IGNORECASE:
+        return "".join(dict.fromkeys(chars + chars.swapcase()))
+    return chars
+
+
+def _class_charset(items: list[tuple[Any, Any]], flags: int) -> str:
+    negate = False
+    chars: list[str] = []
+    for op, av in items:
+        if op == sre_parse.NEGATE:
+            negate = True
+        elif op == sre_parse.LITERAL:
+            chars.append(chr(av))
+        elif op == sre_parse.RANGE:
+            chars.extend(map(chr, range(av[0], av[1] + 1)))
+        elif op == sre_parse.CATEGORY and av in _CATEGORIES:
+            chars.append(_CATEGORIES[av])
+        elif op == sre_parse.CATEGORY and av in _NEGATED_CATEGORIES:
+            excluded = _CATEGORIES[_NEGATED_CATEGORIES[av]]
+            chars.extend(c for c in PRINTABLE_CHARSET if c not in excluded)
+        else:
+            msg = f"unsupported regex syntax in character class: {op}"
+            raise ValueError(msg)
+    charset = _casefold("".join(chars), flags)
+    if negate:
+        charset = "".join(c for c in PRINTABLE_CHARSET if c not in charset)
+    return "".join(dict.fromkeys(charset))
+
+
+def _charset(op: Any, av: Any, flags: int) -> str | None:
+    if op == sre_parse.LITERAL:
+        return _casefold(chr(av), flags)
+    if op == sre_parse.NOT_LITERAL:
+        excluded = _casefold(chr(av), flags)
+        return "".join(c for c in PRINTABLE_CHARSET if c not in excluded)
+    if op == sre_parse.ANY:
+        return PRINTABLE_CHARSET
+    if op == sre_parse.IN:
+        return _class_charset(av, flags)
+    return None
+
+
+def _compile_item(op: Any, av: Any, flags: int, max_repeat: int) -> _Node:
+    charset = _charset(op, av, flags)
+    if charset is not None:
+        if not charset:
+            msg = "character class matches no printable ASCII character"
+            raise ValueError(msg)
+        return _Literal(charset) if len(charset) == 1 else _Chars(charset)
+    if op == sre_parse.BRANCH:
+        return _Branch([_compile(p, flags, max_repeat) for p in av[1]])
+    if op in _GROUPS:
+        if op == sre_parse.SUBPATTERN:
+            # Inline flags, such as (?i:...), apply to the group only
+            _, add_flags, del_flags, av = av
+            flags = (flags | add_flags) & ~del_flags
+        return _compile(av, flags, max_repeat)
+    if op in _REPEATS:
+        low, high, item = av
+        if high == sre_parse.MAXREPEAT:
+            high = low + max_repeat
+        return _Repeat(_compile(item, flags, max_repeat), low, high)
+    if op == sre_parse.AT and av in _START_ANCHORS | _END_ANCHORS:
+        msg = "anchors are only supported at either end of the pattern"
+        raise ValueError(msg)
+    if op == sre_parse.AT:
+        op = av
+    msg = f"unsupported regex syntax: {op}"
+    raise ValueError(msg)
+
+
+def _strip_anchors(items: list[Any]) -> list[Any]:
+    # Anchors at either end of the pattern hold for every generated string
+    start, end = 0, len(items)
+    while start < end and items[start][0] == sre_parse.AT:
+        if items[start][1] not in _START_ANCHORS:
+            break
+        start += 1
+    while end > start and items[end - 1][0] == sre_parse.AT:
+        if items[end - 1][1] not in _END_ANCHORS:
+            break
+        end -= 1
+    return items[start:end]
+
+
+def _compile(items: Any, flags: int, max_repeat: int) -> _Node:
+    nodes: list[_Node] = []
+    for op, av in items:
+        node = _compile_item(op, av, flags, max_repeat)
+        if nodes and isinstance(node, _Literal) and isinstance(nodes[-1], _Literal):
+            nodes[-1] = _Literal(nodes[-1].text + node.text)
+        else:
+            nodes.append(node)
+    if not nodes:
+        return _Literal("")
+    return nodes[0] if len(nodes) == 1 else _Sequence(nodes)
+
+
+class RegexGenerator:
+    """
+    A generator of random strings matching a regular expression, made of
+    literals, character classes, groups, alternations and quantifiers.
+
+    The pattern is parsed once. Unbounded quantifiers (`*`, `+`, `{n,}`) repeat
+    at most `max_repeat` times more than their minimum. Negated classes and `.`
+    only produce printable ASCII characters.
+    """
+
+    def __init__(
+        self, pattern: str | re.Pattern[str], *, max_repeat: int = MAX_REPEAT
+    ) -> None:
+        if max_repeat < 0:
+            msg = "max_repeat must be non-negative"
+            raise ValueError(msg)
+        # Compiling validates the pattern and collects its global inline flags
+        compiled = re.compile(pattern)
+        if not isinstance(compiled.pattern, str):
+            msg = "pattern must be a string"
+            raise TypeError(msg)
+        self.pattern = compiled.pattern
+        parsed = sre_parse.parse(compiled.pattern, compiled.flags)
+        items = _strip_anchors(parsed.data)
+        self._root = _compile(items, compiled.flags, max_repeat)
+
+    def string(self) -> str:
+        """Return a random string matching the pattern."""
+        return self._root.generate(1)[0]
+
+    def strings(self, *, k: int) -> list[str]:
+        """Return a list of `k` random strings matching the pattern."""
+        if k < 0:
+            msg = "k must be non-negative"
+            raise ValueError(msg)
+        return self._root.generate(k)
+
+
+@lru_cache(maxsize=128)
+def _cached_generator(
+    pattern: str | re.Pattern[str], max_repeat: int
+) -> RegexGenerator:
+    return RegexGenerator(pattern, max_repeat=max_repeat)
+
+
+def rand_regex(pattern: str | re.Pattern[str], *, max_repeat: int = MAX_REPEAT) -> str:
+    """
+    Return a random string matching a regular expression (see `RegexGenerator`).
+    The 128 most recently used patterns are kept compiled.
+    """
+    return _cached_generator(pattern, max_repeat).string()
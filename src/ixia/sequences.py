@@ -1,14 +1,17 @@
 from __future__ import annotations
 
-import secrets
+import sys
 from bisect import bisect
-from collections.abc import Iterable, MutableSequence, Sequence
+from collections.abc import Iterable, Iterator, MutableSequence, Sequence
 from enum import Enum
-from itertools import accumulate
-from math import ceil, floor, isfinite, log
-from typing import TypeVar
+from itertools import accumulate, islice, repeat, takewhile
+from math import ceil, exp, floor, inf, isfinite, log, log1p
+from typing import Generic, TypeVar
 
 from .distributions import random
+from .integers import rand_below
+
+ALGORITHM_D_THRESHOLD = 13
 
 T = TypeVar("T")
 E = TypeVar("E", bound=Enum)
@@ -30,7 +33,7 @@ def choice(
         msg = "cannot choose from an empty sequence"
         raise IndexError(msg)
     if weights is None and cumulative_weights is None:
-        return secrets.choice(seq)
+        return seq[rand_below(len(seq))]
     return choices(seq, weights, cumulative_weights=cumulative_weights)[0]
 
 
@@ -81,6 +84,154 @@ def choices(
     return [seq[bisect(cumulative_weights, random() * total, 0, hi)] for _ in range(k)]
 
 
+class DynamicWeightedSampler(Generic[T]):
+    """
+    A collection of weighted items to choose from with replacement, supporting
+    weight updates, insertions and removals in O(log n) time.
+
+    Items are identified by their index, which stays the same until the item is
+    removed. Choices are made in O(log n) time with the same entropy source as
+    `choices`.
+    """
+
+    # A Fenwick tree (binary indexed tree) of the weights: _tree[i] holds the sum
+    # of the weights in the 1-based range (i - (i & -i), i]. The tree is rebuilt
+    # from the exact weights after every n + 1024 changes, so that rounding
+    # errors do not accumulate (amortized O(1) per change).
+
+    def __init__(self, seq: Iterable[T] = (), weights: Iterable[float] = ()) -> None:
+        self._items = list(seq)
+        self._weights = [_check_weight(w) for w in weights]
+        if len(self._items) != len(self._weights):
+            msg = "the number of weights does not match the sequence"
+            raise ValueError(msg)
+        self._free: set[int] = set()
+        self._rebuild()
+
+    def _rebuild(self) -> None:
+        tree = [0.0, *self._weights]
+        n = len(tree)
+        for i in range(1, n):
+            if (j := i + (i & -i)) < n:
+                tree[j] += tree[i]
+        self._tree = tree
+        self._positive = sum(w > 0.0 for w in self._weights)
+        self._changes = 0
+
+    def __len__(self) -> int:
+        return len(self._items) - len(self._free)
+
+    def _prefix_sum(self, i: int) -> float:
+        # Sum of the weights at indices [0, i)
+        tree = self._tree
+        total = 0.0
+        while i:
+            total += tree[i]
+            i &= i - 1
+        return total
+
+    def _set_weight(self, i: int, weight: float) -> None:
+        old = self._weights[i]
+        self._weights[i] = weight
+        self._positive += (weight > 0.0) - (old > 0.0)
+        self._changes += 1
+        if self._changes > len(self._weights) + 1024:
+            self._rebuild()
+            return
+        tree = self._tree
+        n = len(tree)
+        delta = weight - old
+        i += 1
+        while i < n:
+            tree[i] += delta
+            i += i & -i
+
+    def _check_index(self, i: int) -> None:
+        if not 0 <= i < len(self._items) or i in self._free:
+            msg = f"no item at index {i}"
+            raise IndexError(msg)
+
+    @property
+    def total(self) -> float:
+        """The sum of all weights."""
+        return self._prefix_sum(len(self._weights))
+
+    def weight(self, i: int) -> float:
+        """Return the weight of the item at index `i`."""
+        self._check_index(i)
+        return self._weights[i]
+
+    def add(self, item: T, weight: float) -> int:
+        """Add an item with the given weight. Return its index."""
+        weight = _check_weight(weight)
+        if self._free:
+            i = self._free.pop()
+            self._items[i] = item
+            self._set_weight(i, weight)
+            return i
+        i = len(self._items)
+        self._items.append(item)
+        self._weights.append(weight)
+        self._positive += weight > 0.0
+        # The new node covers the 1-based range (i + 1 - lowbit, i + 1]
+        lowbit = (i + 1) & -(i + 1)
+        covered = self._prefix_sum(i) - self._prefix_sum(i + 1 - lowbit)
+        self._tree.append(covered + weight)
+        return i
+
+    def update(self, i: int, weight: float) -> None:
+        """Set the weight of the item at index `i`."""
+        self._check_index(i)
+        self._set_weight(i, _check_weight(weight))
+
+    def remove(self, i: int) -> T:
+        """Remove the item at index `i` and return it."""
+        self._check_index(i)
+        self._set_weight(i, 0.0)
+        self._free.add(i)
+        return self._items[i]
+
+    def _find(self, target: float) -> int:
+        # The first index whose inclusive prefix sum exceeds the target
+        tree = self._tree
+        n = len(tree) - 1
+        pos = 0
+        step = 1 << (n.bit_length() - 1) if n else 0
+        while step:
+            if (nxt := pos + step) <= n and tree[nxt] <= target:
+                pos = nxt
+                target -= tree[nxt]
+            step >>= 1
+        return pos
+
+    def choice(self) -> T:
+        """Choose a random item, with a probability proportional to its weight."""
+        return self.choices(k=1)[0]
+
+    def choices(self, *, k: int) -> list[T]:
+        """Return a `k` sized list of items chosen with replacement."""
+        if not self._positive:
+            msg = "total of weights must be greater than zero"
+            raise ValueError(msg)
+        total = self.total
+        items, weights = self._items, self._weights
+        n = len(weights)
+        out: list[T] = []
+        while len(out) < k:
+            i = self._find(random() * total)
+            # Rounding errors can point past the end or at an item of weight zero
+            if i < n and weights[i]:
+                out.append(items[i])
+        return out
+
+
+def _check_weight(weight: float) -> float:
+    if not 0.0 <= weight < inf:
+        msg = "weights must be non-negative and finite"
+        raise ValueError(msg)
+    return weight + 0.0  # convert to float
+
+
 def sample(seq: Sequence[T], k: int, *, counts: Iterable[int] | None = None) -> list[T]:
     """
     Choose `k` unique random elements from the sequence.
@@ -139,13 +290,13 @@ def sample(seq: Sequence[T], k: int, *, counts: Iterable[int] | None = None) ->
         # Invariant:  non-selected at pool[0 : n-i]
         pool = list(seq)
         for i in range(k):
-            j = secrets.randbelow(n - i)
+            j = rand_below(n - i)
             result.append(pool[j])
             pool[j] = pool[n - i - 1]
     else:
         selected: set[int] = set()
         for _ in range(k):
-            while (j := secrets.randbelow(n)) in selected:
+            while (j := rand_below(n)) in selected:
                 pass
             selected.add(j)
             result.append(seq[j])
@@ -153,6 +304,164 @@ def sample(seq: Sequence[T], k: int, *, counts: Iterable[int] | None = None) ->
     return result
 
 
+def sorted_sample(n: int, k: int) -> Iterator[int]:
+    """
+    Return an iterator over `k` unique random integers from `range(n)`, in
+    increasing order.
+
+    Runs in O(k) time and constant memory, so it is suitable for picking
+    offsets in huge files:
+    ```
+        for offset in sorted_sample(10**12, 10**6):
+            ...
+    ```
+    """
+    if not 0 <= k <= n:
+        msg = "sample larger than sequence or is negative"
+        raise ValueError(msg)
+    return _algorithm_d(n, k)
+
+
+def _algorithm_d(n: int, k: int) -> Iterator[int]:
+    # Jeffrey Scott Vitter, "An Efficient Algorithm for Sequential Random
+    # Sampling", ACM Trans. Math. Softw. 13, 1 (1987), p58-67.
+    # Generates the number of skipped records S directly by rejection, falling
+    # back to Algorithm A once the sample is dense (N <= 13 * n).
+    # Variable names follow the paper: N is the population and n the sample size.
+    big_n, small_n = n, k
+    pos = 0
+    kinv = 1.0 / small_n if small_n else 0.0
+    vprime = exp(log(1.0 - random()) * kinv)
+    qu1 = big_n - small_n + 1
+    threshold = ALGORITHM_D_THRESHOLD * small_n
+    while small_n > 1 and threshold < big_n:
+        kmin1inv = 1.0 / (small_n - 1)
+        while True:
+            # D2: generate X and its floor S, a candidate for the skip
+            while True:
+                x = big_n * (1.0 - vprime)
+                skip = int(x)
+                if skip < qu1:
+                    break
+                vprime = exp(log(1.0 - random()) * kinv)
+            u = 1.0 - random()
+            y1 = exp(log(u * big_n / qu1) * kmin1inv)
+            vprime = y1 * (1.0 - x / big_n) * (qu1 / (qu1 - skip))
+            # D3: accept S by the squeeze
+            if vprime <= 1.0:
+                break
+            # D4: accept S by the exact test
+            y2 = 1.0
+            top = big_n - 1.0
+            if small_n - 1 > skip:
+                bottom = float(big_n - small_n)
+                limit = big_n - skip
+            else:
+                bottom = big_n - skip - 1.0
+                limit = qu1
+            for _ in range(big_n - 1, limit - 1, -1):
+                y2 = y2 * top / bottom
+                top -= 1.0
+                bottom -= 1.0
+            if big_n / (big_n - x) >= y1 * exp(log(y2) * kmin1inv):
+                vprime = exp(log(1.0 - random()) * kmin1inv)
+                break
+            vprime = exp(log(1.0 - random()) * kinv)
+        pos += skip
+        yield pos
+        pos += 1
+        big_n -= skip + 1
+        small_n -= 1
+        kinv = kmin1inv
+        qu1 -= skip
+        threshold -= ALGORITHM_D_THRESHOLD
+    if small_n == 1:
+        yield pos + min(int(big_n * vprime), big_n - 1)
+        return
+    yield from _algorithm_a(pos, big_n, small_n)
+
+
+def _algorithm_a(pos: int, n: int, k: int) -> Iterator[int]:
+    # Vitter's Algorithm A: sequential search for the number of skipped records
+    top = float(n - k)
+    n_real = float(n)
+    for _ in range(k):
+        v = random()
+        skip = 0
+        quot = top / n_real
+        while quot > v:
+            skip += 1
+            top -= 1.0
+            n_real -= 1.0
+            quot = quot * top / n_real
+        pos += skip
+        yield pos
+        pos += 1
+        n_real -= 1.0
+
+
+def _check_probability(p: float) -> None:
+    if not 0.0 <= p <= 1.0:
+        msg = "p must be in range [0, 1]"
+        raise ValueError(msg)
+
+
+def _skips(p: float) -> Iterator[int]:
+    # Geometric method by Devroye, as in binomial_variate: the numbers of failures
+    # between successes are independent geometric variables, generated by
+    # inversion from a single uniform each. For tiny p, a skip can overflow to
+    # infinity, which ends the selection.
+    if p == 1.0:
+        return repeat(0)
+    c = log1p(-p)
+    skips = (log(1.0 - random()) / c for _ in repeat(None))
+    return map(floor, takewhile(isfinite, skips))
+
+
+def rand_indices(n: int, p: float) -> Iterator[int]:
+    """
+    Return an iterator over the indices in `range(n)` selected by independent
+    trials with a probability `p` of success each, in increasing order:
+    ```
+        (i for i in range(n) if rand_bool(p))
+    ```
+    Unselected indices are skipped in constant time, so it runs in O(np) time.
+    """
+    if n < 0:
+        msg = "n must be non-negative"
+        raise ValueError(msg)
+    _check_probability(p)
+    return _rand_indices(n, p) if p else iter(())
+
+
+def _rand_indices(n: int, p: float) -> Iterator[int]:
+    i = -1
+    for skip in _skips(p):
+        i += skip + 1
+        if i >= n:
+            return
+        yield i
+
+
+def rand_filter(iterable: Iterable[T], p: float) -> Iterator[T]:
+    """
+    Return an iterator over the items of `iterable` selected by independent
+    trials with a probability `p` of success each, like `rand_indices`.
+    Unselected items are consumed without generating random numbers.
+    """
+    _check_probability(p)
+    return _rand_filter(iter(iterable), p) if p else iter(())
+
+
+def _rand_filter(it: Iterator[T], p: float) -> Iterator[T]:
+    for skip in _skips(p):
+        for item in islice(it, min(skip, sys.maxsize), None):
+            yield item
+            break
+        else:
+            return
+
+
 def shuffle(seq: MutableSequence[T]) -> None:
     """
     Shuffle the sequence in place, and return `None`.
@@ -160,7 +469,7 @@ def shuffle(seq: MutableSequence[T]) -> None:
     Use `shuffled()` for out of place shuffling.
     """
     for i in range(len(seq) - 1, 0, -1):
-        j = secrets.randbelow(i + 1)
+        j = rand_below(i + 1)
         seq[i], seq[j] = seq[j], seq[i]
 
 
@@ -183,7 +492,7 @@ def rand_enum(enum: type[E]) -> E:
     if not members:
         msg = "enum has 0 members"
         raise ValueError(msg)
-    return secrets.choice(members)
+    return members[rand_below(len(members))]
 
 
 def perm(n: int) -> list[int]:
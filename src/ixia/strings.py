@@ -1,43 +1,215 @@
 from __future__ import annotations
 
-import secrets
+import bz2
+import gzip
+import lzma
 import string
-from base64 import urlsafe_b64encode
-from io import BufferedIOBase, TextIOBase
-from os import PathLike, urandom
+import sys
+from array import array
+from base64 import b32encode, urlsafe_b64encode
+from collections.abc import Sequence
+from functools import lru_cache
+from importlib.resources import files
+from io import BufferedIOBase, FileIO, RawIOBase, TextIOBase
+from itertools import islice
+from math import comb, floor, log, log1p
+from mmap import ACCESS_READ, mmap
+from os import urandom
 from pathlib import Path
-from typing import overload
+from threading import Lock
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Literal, overload
 
-from .distributions import PASSPHRASE_DEFAULT_PATH, _Cache
-from .sequences import choice, choices
+from .distributions import _Cache, _source, _thread_cache, random
+from .integers import rand_below
+from .sequences import choice, choices, shuffle
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping
+    from os import PathLike
+    from typing import TextIO
+
+    from _typeshed import WriteableBuffer
 
 ALNUM_CHARSET = string.ascii_letters + string.digits
+AMBIGUOUS_CHARSET = "0Oo1Il|"
+PASSWORD_DEFAULT_POLICY: Mapping[str, int] = MappingProxyType(
+    {
+        string.ascii_lowercase: 1,
+        string.ascii_uppercase: 1,
+        string.digits: 1,
+        string.punctuation: 1,
+    }
+)
+URANDOM_PATH = Path("/dev/urandom")
+RAND_INTO_CHUNK_SIZE = 1 << 20
+_URANDOM_FILE_LOCK = Lock()
+TokenEncoding = Literal["base64url", "base32", "hex", "uuid4"]
+GZIP_MAGIC = b"\x1f\x8b"
+XZ_MAGIC = b"\xfd7zXZ\x00"
+BZIP2_MAGIC = b"BZh"
+
+
+def _open_compressed(path: Path) -> TextIO | None:
+    # Detect the format by magic bytes rather than by extension
+    with path.open("rb") as f:
+        head = f.read(len(XZ_MAGIC))
+    if head.startswith(GZIP_MAGIC):
+        return gzip.open(path, "rt")
+    if head.startswith(XZ_MAGIC):
+        return lzma.open(path, "rt")
+    if head.startswith(BZIP2_MAGIC):
+        return bz2.open(path, "rt")
+    return None
+
+
+def _read_lines(path: Path) -> list[str]:
+    f = _open_compressed(path)
+    if f is None:
+        return path.read_text().splitlines()
+    with f:
+        return [line.removesuffix("\n") for line in f]
+
+
+def _reservoir_line(lines: Iterator[str]) -> str:
+    # Algorithm L by Kim-Hung Li with a reservoir of one, which draws random
+    # numbers only for the O(log n) lines it keeps rather than for every line
+    # https://doi.org/10.1145/198429.198435
+    chosen = next(lines, None)
+    if chosen is None:
+        msg = "no more data in file"
+        raise EOFError(msg)
+    w = 1.0 - random()
+    while True:
+        skip = floor(log(1.0 - random()) / log1p(-w)) if w < 1.0 else 0
+        line = next(islice(lines, skip, None), None)
+        if line is None:
+            return chosen.removesuffix("\n")
+        chosen = line
+        w *= 1.0 - random()
+
+
+class _WordList(Sequence[str]):
+    # The embedded word list: a little-endian uint16 word count, the uint16
+    # offsets of the words, and a blob of the lowercase words concatenated.
+    # Words are decoded from the (ideally memory-mapped) blob on access.
+
+    def __init__(self, data: bytes | mmap) -> None:
+        n = int.from_bytes(data[:2], "little")
+        self._offsets = array("H", data[2 : 4 + 2 * n])
+        if sys.byteorder == "big":
+            self._offsets.byteswap()
+        self._blob = memoryview(data)[4 + 2 * n :]
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    @overload
+    def __getitem__(self, i: int) -> str: ...
+
+    @overload
+    def __getitem__(self, i: slice) -> list[str]: ...
+
+    def __getitem__(self, i: int | slice) -> str | list[str]:
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            msg = "word list index out of range"
+            raise IndexError(msg)
+        return str(self._blob[self._offsets[i] : self._offsets[i + 1]], "ascii")
+
+
+def _embedded_words() -> _WordList:
+    resource = files("ixia").joinpath("words.bin")
+    if isinstance(resource, Path):
+        with resource.open("rb") as f:
+            return _WordList(mmap(f.fileno(), 0, access=ACCESS_READ))
+    # Not a regular file (e.g. a zipped package)
+    return _WordList(resource.read_bytes())
 
 
 def passphrase(
-    n: int, *, sep: str = "-", words_path: PathLike[str] | str = PASSPHRASE_DEFAULT_PATH
+    n: int, *, sep: str = "-", words_path: PathLike[str] | str | None = None
 ) -> str:
-    """Generate an XKCD-style passphrase."""
+    """
+    Generate an XKCD-style passphrase. Uses a built-in list of 2048 words unless
+    `words_path` is given.
+    """
     if n < 1:
         return ""
-    words_path = Path(words_path)
-    if words_path == PASSPHRASE_DEFAULT_PATH and not words_path.exists():
-        msg = "word list unavailable at the default path; please provide a valid path"
-        raise NotImplementedError(msg)
-    if not (_Cache.words and _Cache.words_path == words_path):
-        _Cache.words = words_path.read_text().splitlines()
-        _Cache.words_path = words_path
-    return sep.join(choices(_Cache.words, k=n)).lower()
+    path = None if words_path is None else Path(words_path)
+    cached = _Cache.words
+    if cached is None or cached[0] != path:
+        words = (
+            _embedded_words()
+            if path is None
+            else [word.lower() for word in _read_lines(path)]
+        )
+        cached = _Cache.words = (path, words)
+    return sep.join(choices(cached[1], k=n))
+
+
+def _check_secure(name: str) -> None:
+    # Raw random data is typically used for keys, tokens or nonces, which must
+    # never come from the non-cryptographic fast mode generator
+    if _thread_cache.fast_rng is not None:
+        msg = f"{name} is not available in fast mode"
+        raise RuntimeError(msg)
+
+
+def _rand_bytes(n: int) -> bytes:
+    return _source()(n)
 
 
 def rand_bytes(n: int = 32) -> bytes:
     """Generate `n` random bytes. Defaults to 32."""
-    return urandom(n)
+    _check_secure("rand_bytes")
+    return _rand_bytes(n)
 
 
 def rand_hex(n: int) -> str:
     """Return a hex string composed of `n` random bytes."""
-    return "".join(f"{secrets.randbelow(255):02x}" for _ in range(n))
+    _check_secure("rand_hex")
+    return _rand_bytes(max(n, 0)).hex()
+
+
+def _urandom_file() -> FileIO | None:
+    if _Cache.urandom_file is None and URANDOM_PATH.exists():
+        with _URANDOM_FILE_LOCK:
+            if _Cache.urandom_file is None:
+                _Cache.urandom_file = FileIO(URANDOM_PATH)
+    return _Cache.urandom_file
+
+
+def rand_into(buffer: WriteableBuffer) -> int:
+    """
+    Fill a writable buffer with random bytes in place. Return the number of bytes
+    written.
+    """
+    _check_secure("rand_into")
+    return _rand_into(buffer)
+
+
+def _rand_into(buffer: WriteableBuffer) -> int:
+    view = memoryview(buffer)
+    if view.readonly:
+        msg = "buffer must be writable"
+        raise TypeError(msg)
+    data = view.cast("B")
+    n = data.nbytes
+    source = _source()
+    if source is urandom and (file := _urandom_file()) is not None:
+        # Read the kernel RNG straight into the buffer
+        pos = 0
+        while pos < n:
+            pos += file.readinto(data[pos:]) or 0
+        return n
+    for pos in range(0, n, RAND_INTO_CHUNK_SIZE):
+        end = min(pos + RAND_INTO_CHUNK_SIZE, n)
+        data[pos:end] = source(end - pos)
+    return n
 
 
 @overload
@@ -54,6 +226,8 @@ def rand_line(file: TextIOBase | BufferedIOBase | PathLike[str] | str) -> str |
     a path, read it, and return a random line from the read content.
     Given a readable IO object, read it, and return a random line from the read content.
     Return a bytes object if provided an IO object in binary mode.
+    Gzip, XZ and bzip2 compressed files are detected and decompressed on the fly,
+    without holding the decompressed content in memory.
     """
     if isinstance(file, (TextIOBase, BufferedIOBase)):
         try:
@@ -65,20 +239,200 @@ def rand_line(file: TextIOBase | BufferedIOBase | PathLike[str] | str) -> str |
         except IndexError:
             msg = "no more data in file"
             raise EOFError(msg) from None
-    with Path(file).open() as f:
+    path = Path(file)
+    compressed = _open_compressed(path)
+    if compressed is not None:
+        with compressed:
+            return _reservoir_line(compressed)
+    with path.open() as f:
         return rand_line(f)
 
 
 def rand_urlsafe(n: int = 32) -> str:
     """Return a random URL-safe text string, in Base64 encoding."""
-    return urlsafe_b64encode(rand_bytes(n)).rstrip(b"=").decode("ascii")
+    _check_secure("rand_urlsafe")
+    return urlsafe_b64encode(_rand_bytes(n)).rstrip(b"=").decode("ascii")
 
 
 def rand_printable(n: int) -> str:
     """Return a random printable ASCII (32..126) string of length `n`."""
-    return "".join(chr(secrets.randbelow(95) + 32) for _ in range(n))
+    return "".join(chr(rand_below(95) + 32) for _ in range(n))
 
 
 def rand_alnum(n: int) -> str:
     """Return a random alphanumeric string of length `n`."""
     return "".join(choices(ALNUM_CHARSET, k=n))
+
+
+@lru_cache(maxsize=64)
+def _password_counts(
+    sizes: tuple[int, ...], minimums: tuple[int, ...], length: int
+) -> tuple[tuple[int, ...], ...]:
+    # ways[i][r] is the number of strings of length r over character sets i and
+    # onwards that contain at least minimums[j] characters from each set j >= i
+    ways = [[0] * (length + 1) for _ in range(len(sizes))] + [[1] + [0] * length]
+    for i in reversed(range(len(sizes))):
+        size, lo, rest = sizes[i], minimums[i], ways[i + 1]
+        for r in range(lo, length + 1):
+            ways[i][r] = sum(
+                comb(r, c) * size**c * rest[r - c] for c in range(lo, r + 1)
+            )
+    return tuple(map(tuple, ways))
+
+
+def rand_password(
+    length: int,
+    policy: Mapping[str, int] = PASSWORD_DEFAULT_POLICY,
+    *,
+    exclude: str = "",
+) -> str:
+    """
+    Return a random password of length `length`. `policy` maps disjoint character
+    sets to the minimum number of characters required from each of them, and the
+    password is chosen uniformly among all strings over the sets' union (without
+    the characters in `exclude`) that satisfy it.
+    """
+    _check_secure("rand_password")
+    if length < 0:
+        msg = "length must be non-negative"
+        raise ValueError(msg)
+    charsets = [
+        "".join(dict.fromkeys(c for c in cs if c not in exclude)) for cs in policy
+    ]
+    if len(set().union(*charsets)) != sum(map(len, charsets)):
+        msg = "character sets must be disjoint"
+        raise ValueError(msg)
+    sizes = tuple(map(len, charsets))
+    minimums = tuple(policy.values())
+    if min(minimums, default=0) < 0:
+        msg = "minimum counts must be non-negative"
+        raise ValueError(msg)
+    ways = _password_counts(sizes, minimums, length)
+    if not ways[0][length]:
+        msg = "no password satisfies the policy"
+        raise ValueError(msg)
+
+    # Choose how many characters come from each set, weighted by the number of
+    # passwords with those counts, then fill the positions and shuffle them
+    chars: list[str] = []
+    remaining = length
+    for i, charset in enumerate(charsets):
+        x = rand_below(ways[i][remaining])
+        count = minimums[i]
+        while True:
+            w = comb(remaining, count) * sizes[i] ** count
+            w *= ways[i + 1][remaining - count]
+            if x < w:
+                break
+            x -= w
+            count += 1
+        chars.extend(choices(charset, k=count))
+        remaining -= count
+    shuffle(chars)
+    return "".join(chars)
+
+
+def _uuid4_tokens(k: int) -> list[str]:
+    h = _rand_bytes(16 * k).hex()
+    # Overwrite the version nibble with 4 and the variant bits with 0b10
+    return [
+        f"{h[i : i + 8]}-{h[i + 8 : i + 12]}-4{h[i + 13 : i + 16]}-"
+        f"{'89ab'[int(h[i + 16], 16) & 3]}{h[i + 17 : i + 20]}-{h[i + 20 : i + 32]}"
+        for i in range(0, 32 * k, 32)
+    ]
+
+
+def _encoded_tokens(k: int, nbytes: int, encoding: TokenEncoding) -> list[str]:
+    if encoding == "uuid4":
+        return _uuid4_tokens(k)
+    if not nbytes:
+        return [""] * k
+    if encoding == "hex":
+        text = _rand_bytes(k * nbytes).hex()
+        width = length = 2 * nbytes
+    else:
+        # Round each token up to whole encoding groups (3 bytes -> 4 chars for
+        # Base64, 5 bytes -> 8 chars for Base32) so that one encoding pass over
+        # the batch can be sliced into tokens, then drop the surplus characters
+        group, chars, encode = (
+            (3, 4, urlsafe_b64encode) if encoding == "base64url" else (5, 8, b32encode)
+        )
+        groups = -(-nbytes // group)
+        text = encode(_rand_bytes(k * groups * group)).decode("ascii")
+        width = groups * chars
+        length = -(-nbytes * chars // group)
+    return [text[i : i + length] for i in range(0, k * width, width)]
+
+
+def _token_bits(nbytes: int, encoding: TokenEncoding) -> int:
+    if encoding == "uuid4":
+        return 122
+    if encoding == "hex":
+        return 8 * nbytes
+    if encoding == "base64url":
+        return 6 * -(-nbytes * 4 // 3)
+    return 5 * -(-nbytes * 8 // 5)
+
+
+def tokens(
+    k: int,
+    nbytes: int = 32,
+    *,
+    encoding: TokenEncoding = "base64url",
+    unique: bool = False,
+) -> list[str]:
+    """
+    Return a list of `k` random tokens, each made from at least `nbytes` random bytes
+    (ignored for UUIDs), encoded as URL-safe Base64, Base32, hex or RFC 4122 UUIDv4.
+    If `unique` is true, the tokens are guaranteed to be distinct.
+    """
+    _check_secure("tokens")
+    if encoding not in {"base64url", "base32", "hex", "uuid4"}:
+        msg = f"unknown token encoding: {encoding!r}"
+        raise ValueError(msg)
+    if k < 0:
+        msg = "k must be non-negative"
+        raise ValueError(msg)
+    if nbytes < 0:
+        msg = "negative argument not allowed"
+        raise ValueError(msg)
+    # k > 2**bits, without building 2**bits
+    if unique and max(k - 1, 0).bit_length() > _token_bits(nbytes, encoding):
+        msg = "not enough possible tokens for a unique batch"
+        raise ValueError(msg)
+    out = _encoded_tokens(k, nbytes, encoding)
+    if not unique:
+        return out
+    out = list(dict.fromkeys(out))
+    while len(out) < k:
+        out = list(dict.fromkeys(out + _encoded_tokens(k - len(out), nbytes, encoding)))
+    return out
+
+
+class RandomStream(RawIOBase):
+    """
+    A readable raw stream of random bytes, e.g. for `shutil.copyfileobj`.
+    Reaches EOF after `size` bytes if given, otherwise never ends.
+    """
+
+    def __init__(self, size: int | None = None) -> None:
+        super().__init__()
+        if size is not None and size < 0:
+            msg = "size must be non-negative"
+            raise ValueError(msg)
+        self._remaining = size
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: WriteableBuffer) -> int:
+        """Fill `buffer` with random bytes. Return the number of bytes read."""
+        if self.closed:
+            msg = "I/O operation on closed stream"
+            raise ValueError(msg)
+        data = memoryview(buffer).cast("B")
+        if self._remaining is None:
+            return rand_into(data)
+        n = rand_into(data[: self._remaining])
+        self._remaining -= n
+        return n
@@ -1,11 +1,20 @@
 import datetime as dt
+import re
+from collections import Counter
+from typing import Callable
+
+import pytest
 
 from ixia.date_time import (
+    Datelike,
+    Timelike,
     _convert_date,
     _convert_time,
     _microseconds,
     rand_date,
+    rand_dates,
     rand_time,
+    rand_times,
 )
 
 
@@ -78,3 +87,64 @@ def test_rand_time() -> None:
 
     # with none as input
     assert dt.time.min <= rand_time() <= dt.time.max
+
+
+def test_rand_date_masked() -> None:
+    holidays: list[Datelike] = [dt.date(2024, 1, 1), "2024-12-25", (2024, 12, 26)]
+    dates = rand_dates(2024, weekdays=range(5), exclude=holidays, k=10_000)
+    assert all(dt.date(2024, 1, 2) <= d <= dt.date(2024, 12, 31) for d in dates)
+    assert {d.weekday() for d in dates} == set(range(5))
+    assert not {dt.date(2024, 12, 25), dt.date(2024, 12, 26)} & set(dates)
+
+    # Saturdays and Sundays of June 2024, without June 15
+    dates = rand_dates(
+        "2024-06-01", "2024-06-30", weekdays=[5, 6], exclude=["2024-06-15"], k=1000
+    )
+    assert set(dates) == {dt.date(2024, 6, d) for d in (1, 2, 8, 9, 16, 22, 23, 29, 30)}
+    assert rand_date(2024, weekdays=[6], exclude=[]).weekday() == 6
+
+
+def test_rand_dates_uniform() -> None:
+    counts = Counter(rand_dates("2024-06-03", "2024-06-09", weekdays={0, 2}, k=10_000))
+    assert counts.keys() == {dt.date(2024, 6, 3), dt.date(2024, 6, 5)}
+    assert 4500 < counts[dt.date(2024, 6, 3)] < 5500
+
+
+def test_rand_time_windows() -> None:
+    windows: list[tuple[Timelike, Timelike]] = [(9, 12), ((13, 0), "17:00"), (10, 11)]
+    times = rand_times(windows=windows, k=10_000)
+    assert all(dt.time(9) <= t <= dt.time(17) for t in times)
+    assert not [t for t in times if dt.time(12) < t < dt.time(13)]
+    morning = sum(t <= dt.time(12) for t in times)
+    assert 3900 < morning < 4700
+    assert dt.time(8) <= rand_time(windows=[(8, 8)]) <= dt.time(8)
+    assert len(rand_times(6, 7, k=5)) == 5
+
+
+@pytest.mark.parametrize(
+    ("action", "exc_msg"),
+    [
+        (lambda: rand_date(2024, weekdays=[7]), "weekdays must be integers in range"),
+        (
+            lambda: rand_date("2024-06-01", "2024-06-02", weekdays=range(5)),
+            "no date in range satisfies the constraints",
+        ),
+        (
+            lambda: rand_date("2024-06-02", "2024-06-01"),
+            "no date in range satisfies the constraints",
+        ),
+        (lambda: rand_time(12, 11), "empty range for rand_time"),
+        (
+            lambda: rand_time(9, windows=[(9, 17)]),
+            "windows cannot be combined with start or end",
+        ),
+        (lambda: rand_time(windows=[]), "no time windows given"),
+        (
+            lambda: rand_time(windows=[(17, 9)]),
+            "time windows must not end before they start",
+        ),
+    ],
+)
+def test_date_time_erroneous_cases(action: Callable[[], object], exc_msg: str) -> None:
+    with pytest.raises(ValueError, match=re.escape(exc_msg)):
+        action()
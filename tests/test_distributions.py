@@ -2,25 +2,47 @@ from __future__ import annotations
 
 import math
 import re
+from concurrent.futures import ThreadPoolExecutor
+from fractions import Fraction
+from statistics import NormalDist, mean, stdev, variance
 from typing import TYPE_CHECKING
 
 import pytest
 
 from ixia import (
+    EmpiricalDistribution,
+    MultivariateNormal,
     beta_variate,
+    beta_variates,
     binomial_variate,
+    dirichlet_variate,
+    dirichlet_variates,
     expo_variate,
     gamma_variate,
+    gamma_variates,
     gauss,
+    geometric_variate,
+    geometric_variates,
+    hypergeometric_variate,
+    hypergeometric_variates,
     log_norm_variate,
+    multinomial,
+    multivariate_hypergeometric,
+    negative_binomial_variate,
+    negative_binomial_variates,
     normal_variate,
     pareto_variate,
+    poisson_variate,
+    poisson_variates,
     random,
     triangular,
+    truncated_expo_variate,
+    truncated_normal_variate,
     uniform,
     von_mises_variate,
     weibull_variate,
 )
+from ixia.distributions import _thread_cache
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -80,6 +102,68 @@ def test_binomial_variate_erroneous_cases(
         binomial_variate(*args)
 
 
+def test_empirical_distribution() -> None:
+    dist = EmpiricalDistribution([1.0, 2.0, 3.0, 10.0], table_size=64)
+    values = dist.variates(k=20_000)
+    assert 1.0 <= min(values) <= max(values) <= 10.0
+    assert mean(values) == pytest.approx(3.5, rel=0.05)
+    assert 1.0 <= dist.variate() <= 10.0
+    assert EmpiricalDistribution([5.0]).variates(k=3) == [5.0] * 3
+
+
+def test_empirical_distribution_from_histogram() -> None:
+    dist = EmpiricalDistribution.from_histogram([0.0, 1.0, 2.0, 4.0], [0, 1, 3])
+    values = dist.variates(k=20_000)
+    assert 1.0 <= min(values) <= max(values) <= 4.0
+    assert sum(x < 2.0 for x in values) / 2e4 == pytest.approx(0.25, abs=0.02)
+
+
+def test_empirical_distribution_from_ppf() -> None:
+    dist = EmpiricalDistribution.from_ppf(NormalDist(5.0, 2.0).inv_cdf)
+    values = dist.variates(k=50_000)
+    assert mean(values) == pytest.approx(5.0, abs=0.05)
+    assert stdev(values) == pytest.approx(2.0, rel=0.05)
+    uniform_dist = EmpiricalDistribution.from_ppf(lambda p: 3.0 * p, table_size=4)
+    assert all(0.0 <= x < 3.0 for x in uniform_dist.variates(k=1000))
+
+
+@pytest.mark.parametrize(
+    ("factory", "exc_msg"),
+    [
+        (lambda: EmpiricalDistribution([]), "samples must not be empty"),
+        (
+            lambda: EmpiricalDistribution([1.0], table_size=0),
+            "table size must be positive",
+        ),
+        (
+            lambda: EmpiricalDistribution.from_histogram([0.0, 1.0], [1, 2]),
+            "edges must have exactly one more element than counts",
+        ),
+        (
+            lambda: EmpiricalDistribution.from_histogram([1.0, 0.0], [1]),
+            "edges must be strictly increasing",
+        ),
+        (
+            lambda: EmpiricalDistribution.from_histogram([0.0, 1.0], [-1]),
+            "counts must be non-negative",
+        ),
+        (
+            lambda: EmpiricalDistribution.from_histogram([0.0, 1.0], [0]),
+            "total count must be greater than zero",
+        ),
+        (
+            lambda: EmpiricalDistribution.from_ppf(lambda p: -p),
+            "quantile function must be non-decreasing",
+        ),
+    ],
+)
+def test_empirical_distribution_erroneous_cases(
+    factory: Callable[[], EmpiricalDistribution], exc_msg: str
+) -> None:
+    with pytest.raises(ValueError, match=re.escape(exc_msg)):
+        factory()
+
+
 def test_expo_variate() -> None:
     for _ in range(100):
         assert expo_variate(1e309) == 0.0
@@ -114,6 +198,48 @@ def test_gamma_variate_nonpositive_inputs(alpha: float, beta: float) -> None:
         gamma_variate(alpha, beta)
 
 
+@pytest.mark.parametrize("alpha", [0.2, 1.0, 3.5, 50.0])
+def test_gamma_variates_moments(alpha: float) -> None:
+    values = gamma_variates(alpha, 2.0, k=50_000)
+    assert mean(values) == pytest.approx(2.0 * alpha, rel=0.05)
+    assert variance(values) == pytest.approx(4.0 * alpha, rel=0.1)
+
+
+def test_beta_variates() -> None:
+    values = beta_variates(2.0, 5.0, k=50_000)
+    assert all(0.0 <= x <= 1.0 for x in values)
+    assert mean(values) == pytest.approx(2 / 7, rel=0.05)
+    assert beta_variates(1.0, 1.0, k=0) == []
+
+
+def test_dirichlet_variates() -> None:
+    rows = dirichlet_variates([1.0, 2.0, 3.0], k=20_000)
+    assert len(rows) == 20_000
+    assert all(sum(row) == pytest.approx(1.0) for row in rows)
+    means = [mean(column) for column in zip(*rows)]
+    assert means == pytest.approx([1 / 6, 2 / 6, 3 / 6], rel=0.05)
+    assert dirichlet_variate([0.5]) == [1.0]
+    assert sum(dirichlet_variate([1e-3] * 5)) == pytest.approx(1.0)
+
+
+@pytest.mark.parametrize(
+    ("alphas", "exc_msg"),
+    [([], "alphas must not be empty"), ([1.0, 0.0], "all alphas must be > 0.0")],
+)
+def test_dirichlet_variate_erroneous_cases(alphas: list[float], exc_msg: str) -> None:
+    with pytest.raises(ValueError, match=re.escape(exc_msg)):
+        dirichlet_variate(alphas)
+
+
+def test_gauss_thread_local_spare() -> None:
+    _thread_cache.gauss_next = None
+    gauss()  # leaves a spare value for this thread
+    assert _thread_cache.gauss_next is not None
+    with ThreadPoolExecutor(1) as pool:
+        assert pool.submit(lambda: _thread_cache.gauss_next).result() is None
+    assert _thread_cache.gauss_next is not None
+
+
 def test_gauss_sigma_zero() -> None:
     for _ in range(1000):
         mu = random()
@@ -126,12 +252,228 @@ def test_gauss(mu: float, sigma: float) -> None:
         assert mu - 8 * sigma <= gauss() <= mu + 8 * sigma
 
 
+@pytest.mark.parametrize("p", [1.0, 0.9, 0.5, 0.01])
+def test_geometric_variate(p: float) -> None:
+    assert geometric_variate(p) >= 1
+    values = geometric_variates(p, k=100_000)
+    assert min(values) >= 1
+    assert math.isclose(sum(values) / 1e5, 1 / p, rel_tol=0.05)
+
+
+@pytest.mark.parametrize("p", [1e-12, 1e-17, 1e-300])
+def test_geometric_variate_tiny_p(p: float) -> None:
+    values = geometric_variates(p, k=10_000)
+    assert min(values) >= 1
+    assert math.isclose(sum(values) / 1e4, 1 / p, rel_tol=0.05)
+
+
+def test_geometric_variate_overflow() -> None:
+    values = geometric_variates(p := 1e-320, k=10_000)
+    assert min(values) >= 1
+    assert math.isclose(sum(values) * Fraction(p) / 10_000, 1, rel_tol=0.05)
+
+
+@pytest.mark.parametrize("p", [0.0, -0.5, 1.5])
+def test_geometric_variate_erroneous_cases(p: float) -> None:
+    with pytest.raises(ValueError, match=re.escape("p must be in range (0, 1]")):
+        geometric_variate(p)
+
+
+@pytest.mark.parametrize(
+    ("ngood", "nbad", "nsample"),
+    [
+        (0, 10, 5),
+        (10, 0, 5),
+        (5, 7, 12),
+        (5, 7, 4),
+        (3, 100, 90),
+        (100, 3, 90),
+        (70, 30, 80),
+        (1000, 5000, 3000),
+        (10**6, 10**6, 10**5),
+    ],
+)
+def test_hypergeometric_variate(ngood: int, nbad: int, nsample: int) -> None:
+    lo, hi = max(0, nsample - nbad), min(nsample, ngood)
+    assert lo <= hypergeometric_variate(ngood, nbad, nsample) <= hi
+    values = hypergeometric_variates(ngood, nbad, nsample, k=20_000)
+    assert lo <= min(values) <= max(values) <= hi
+    expected_mean = nsample * ngood / (ngood + nbad)
+    assert math.isclose(sum(values) / 2e4, expected_mean, rel_tol=0.05, abs_tol=0.05)
+
+
+@pytest.mark.parametrize(
+    ("args", "exc_msg"),
+    [
+        ((-1, 5, 2), "ngood and nbad must be non-negative"),
+        ((5, -1, 2), "ngood and nbad must be non-negative"),
+        ((5, 5, 11), "nsample must be in range [0, ngood + nbad]"),
+        ((5, 5, -1), "nsample must be in range [0, ngood + nbad]"),
+    ],
+)
+def test_hypergeometric_variate_erroneous_cases(
+    args: tuple[int, int, int], exc_msg: str
+) -> None:
+    with pytest.raises(ValueError, match=re.escape(exc_msg)):
+        hypergeometric_variate(*args)
+
+
 def test_log_norm_variate() -> None:
     for _ in range(1000):
         assert log_norm_variate(0, 1) > 0
         assert log_norm_variate(11, 0) == math.exp(11)
 
 
+@pytest.mark.parametrize(
+    ("k", "weights"),
+    [
+        (0, [1.0]),
+        (10, [1.0]),
+        (100, [0.2, 0.3, 0.5]),
+        (10**9, [1, 0, 2, 3, 0]),
+        (10**6, [1e-9, 1.0, 1e-9]),
+    ],
+)
+def test_multinomial(k: int, weights: list[float]) -> None:
+    for _ in range(100):
+        counts = multinomial(k, weights)
+        assert len(counts) == len(weights)
+        assert sum(counts) == k
+        assert all(c == 0 for c, w in zip(counts, weights) if not w)
+
+    means = [
+        sum(c) / 1e4 for c in zip(*(multinomial(100, [1, 3]) for _ in range(10_000)))
+    ]
+    assert math.isclose(means[0], 25, rel_tol=0.05)
+    assert math.isclose(means[1], 75, rel_tol=0.05)
+
+
+@pytest.mark.parametrize(
+    ("args", "exc_msg"),
+    [
+        ((-1, [1.0]), "k must be non-negative"),
+        ((1, [1.0, -1.0]), "weights must be non-negative"),
+        ((1, []), "total of weights must be greater than zero"),
+        ((1, [0.0, 0.0]), "total of weights must be greater than zero"),
+        ((1, [1.0, 1e309]), "total of weights must be finite"),
+    ],
+)
+def test_multinomial_erroneous_cases(
+    args: tuple[int, list[float]], exc_msg: str
+) -> None:
+    with pytest.raises(ValueError, match=re.escape(exc_msg)):
+        multinomial(*args)
+
+
+@pytest.mark.parametrize(
+    ("k", "counts"),
+    [(0, [5]), (5, [5]), (30, [10, 20, 30]), (10**6, [10**6, 5 * 10**5, 0, 3 * 10**5])],
+)
+def test_multivariate_hypergeometric(k: int, counts: list[int]) -> None:
+    for _ in range(100):
+        out = multivariate_hypergeometric(k, counts)
+        assert sum(out) == k
+        assert all(0 <= x <= c for x, c in zip(out, counts))
+
+    assert multivariate_hypergeometric(60, [10, 20, 30]) == [10, 20, 30]
+
+
+@pytest.mark.parametrize(
+    ("args", "exc_msg"),
+    [
+        ((1, [1, -1]), "counts must be non-negative"),
+        ((4, [1, 2]), "sample larger than population or is negative"),
+        ((-1, [1, 2]), "sample larger than population or is negative"),
+    ],
+)
+def test_multivariate_hypergeometric_erroneous_cases(
+    args: tuple[int, list[int]], exc_msg: str
+) -> None:
+    with pytest.raises(ValueError, match=re.escape(exc_msg)):
+        multivariate_hypergeometric(*args)
+
+
+def test_multivariate_normal() -> None:
+    mean = [1.0, -2.0, 3.0]
+    cov = [[4.0, 2.0, 0.0], [2.0, 5.0, 1.0], [0.0, 1.0, 3.0]]
+    dist = MultivariateNormal(mean, cov)
+    assert len(dist.variate()) == 3
+
+    k = 50_000
+    values = dist.variates(k=k)
+    assert len(values) == 3 * k
+    cols = [values[i::3] for i in range(3)]
+    means = [sum(c) / k for c in cols]
+    for m, expected in zip(means, mean):
+        assert math.isclose(m, expected, abs_tol=0.05)
+    for i in range(3):
+        for j in range(3):
+            c = sum((x - means[i]) * (y - means[j]) for x, y in zip(cols[i], cols[j]))
+            assert math.isclose(c / k, cov[i][j], abs_tol=0.15)
+
+
+def test_multivariate_normal_semi_definite() -> None:
+    dist = MultivariateNormal([0.0, 0.0, 1.0], [[1, 1, 0], [1, 1, 0], [0, 0, 0]])
+    for _ in range(100):
+        x, y, z = dist.variate()
+        assert math.isclose(x, y)
+        assert z == 1.0
+
+
+@pytest.mark.parametrize(
+    ("mean", "cov", "exc_msg"),
+    [
+        ([0, 0], [[1, 0]], "covariance matrix must be square and match the mean"),
+        ([0], [[1, 0], [0, 1]], "covariance matrix must be square and match the mean"),
+        ([0, 0], [[1, 0.5], [0, 1]], "covariance matrix must be symmetric"),
+        (
+            [0, 0],
+            [[1, 2], [2, 1]],
+            "covariance matrix must be positive semi-definite",
+        ),
+        (
+            [0, 0],
+            [[0, 1], [1, 0]],
+            "covariance matrix must be positive semi-definite",
+        ),
+        (
+            [0, 0, 0],
+            [[1, 1, 0], [1, 1, 1], [0, 1, 1]],
+            "covariance matrix must be positive semi-definite",
+        ),
+    ],
+)
+def test_multivariate_normal_erroneous_cases(
+    mean: list[float], cov: list[list[float]], exc_msg: str
+) -> None:
+    with pytest.raises(ValueError, match=re.escape(exc_msg)):
+        MultivariateNormal(mean, cov)
+
+
+@pytest.mark.parametrize(("n", "p"), [(1, 1.0), (3, 0.3), (10.5, 0.9), (1000, 0.5)])
+def test_negative_binomial_variate(n: float, p: float) -> None:
+    assert negative_binomial_variate(n, p) >= 0
+    values = negative_binomial_variates(n, p, k=20_000)
+    assert min(values) >= 0
+    expected_mean = n * (1 - p) / p
+    assert math.isclose(sum(values) / 2e4, expected_mean, rel_tol=0.05)
+
+
+@pytest.mark.parametrize(
+    ("args", "exc_msg"),
+    [
+        ((0, 0.5), "n must be greater than zero"),
+        ((1, 0.0), "p must be in range (0, 1]"),
+        ((1, 1.5), "p must be in range (0, 1]"),
+    ],
+)
+def test_negative_binomial_variate_erroneous_cases(
+    args: tuple[float, float], exc_msg: str
+) -> None:
+    with pytest.raises(ValueError, match=re.escape(exc_msg)):
+        negative_binomial_variate(*args)
+
+
 def test_normal_variate() -> None:
     for _ in range(1000):
         assert 980 < normal_variate(1000, 1) < 1020
@@ -166,6 +508,22 @@ def test_pareto_variate_zero_fail() -> None:
         pareto_variate(0.0)
 
 
+@pytest.mark.parametrize("lambda_", [0.0, 0.5, 3.0, 9.9, 10.0, 50.0, 1e6])
+def test_poisson_variate(lambda_: float) -> None:
+    assert poisson_variate(lambda_) >= 0
+    values = poisson_variates(lambda_, k=20_000)
+    assert min(values) >= 0
+    mean = sum(values) / 2e4
+    assert math.isclose(mean, lambda_, rel_tol=0.05)
+    variance = sum((v - mean) ** 2 for v in values) / 2e4
+    assert math.isclose(variance, lambda_, rel_tol=0.1)
+
+
+def test_poisson_variate_negative() -> None:
+    with pytest.raises(ValueError, match=re.escape("lambda_ must be non-negative")):
+        poisson_variate(-1.0)
+
+
 def test_random() -> None:
     for _ in range(100_000):
         assert 0.0 <= random() < 1.0
@@ -194,6 +552,75 @@ def test_triangular_skews(mode: float, meets_criteria: Callable[[float], bool])
         assert meets_criteria(mean)
 
 
+@pytest.mark.parametrize(
+    ("low", "high"),
+    [
+        (-math.inf, math.inf),
+        (-0.01, 0.01),
+        (-0.5, 3.0),
+        (1.0, 3.0),
+        (2.0, 2.01),
+        (-5.0, -3.0),
+        (6.0, math.inf),
+        (-math.inf, -10.0),
+    ],
+)
+def test_truncated_normal_variate(low: float, high: float) -> None:
+    mu, sigma = 1.0, 2.0
+    a, b = (low - mu) / sigma, (high - mu) / sigma
+    pdf = NormalDist().pdf
+    expected = (pdf(a) - pdf(b)) / (
+        0.5 * (math.erfc(a / math.sqrt(2)) - math.erfc(b / math.sqrt(2)))
+    )
+    samples = [truncated_normal_variate(mu, sigma, low, high) for _ in range(20_000)]
+    assert all(low <= x <= high for x in samples)
+    assert math.isclose((mean(samples) - mu) / sigma, expected, abs_tol=0.03)
+
+
+def test_truncated_expo_variate() -> None:
+    samples = [truncated_expo_variate(2.0, 1.0, 3.0) for _ in range(20_000)]
+    assert all(1.0 <= x <= 3.0 for x in samples)
+    expected = 1.0 + 0.5 - 2.0 * math.exp(-4.0) / (1.0 - math.exp(-4.0))
+    assert math.isclose(mean(samples), expected, abs_tol=0.02)
+
+    samples = [truncated_expo_variate(-2.0, 1.0, 3.0) for _ in range(20_000)]
+    assert all(1.0 <= x <= 3.0 for x in samples)
+    assert math.isclose(mean(samples), 4.0 - expected, abs_tol=0.02)
+
+    assert 0.0 <= truncated_expo_variate(0.0, 0.0, 1.0) <= 1.0
+    assert math.isclose(
+        mean(truncated_expo_variate() for _ in range(20_000)), 1.0, abs_tol=0.05
+    )
+    assert 1e3 <= truncated_expo_variate(1.0, 1e3) <= 1e3 + 50
+
+
+@pytest.mark.parametrize(
+    ("action", "exc_msg"),
+    [
+        (
+            lambda: truncated_normal_variate(0.0, 0.0, -1.0, 1.0),
+            "truncated_normal_variate: sigma must be > 0.0",
+        ),
+        (
+            lambda: truncated_normal_variate(0.0, 1.0, 1.0, 1.0),
+            "low must be less than high",
+        ),
+        (lambda: truncated_expo_variate(1.0, 2.0, 1.0), "low must be less than high"),
+        (
+            lambda: truncated_expo_variate(-1.0, 0.0),
+            "the range must be bounded where the density does not decay",
+        ),
+        (
+            lambda: truncated_expo_variate(1.0, -math.inf, 0.0),
+            "the range must be bounded where the density does not decay",
+        ),
+    ],
+)
+def test_truncated_erroneous_cases(action: Callable[[], float], exc_msg: str) -> None:
+    with pytest.raises(ValueError, match=re.escape(exc_msg)):
+        action()
+
+
 def test_uniform() -> None:
     a, b = -10, 15
     for _ in range(1000):
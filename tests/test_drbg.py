@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+import pytest
+
+from ixia import (
+    DRBG,
+    fast_mode,
+    passphrase,
+    rand_alnum,
+    rand_bytes,
+    rand_hex,
+    rand_int,
+    rand_into,
+    rand_password,
+    rand_urlsafe,
+    random,
+    tokens,
+    use_drbg,
+    use_urandom,
+)
+from ixia.distributions import _Cache, _thread_cache
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+
+@pytest.fixture
+def drbg() -> Iterator[DRBG]:
+    yield use_drbg(DRBG(block_size=64, reseed_interval=256))
+    use_urandom()
+
+
+def test_drbg_rand_bytes() -> None:
+    gen = DRBG(block_size=16, reseed_interval=64)
+    assert gen.rand_bytes(0) == b""
+    for n in (1, 15, 16, 17, 100):
+        assert len(gen.rand_bytes(n)) == n
+    assert len({gen.rand_bytes(8) for _ in range(1000)}) == 1000
+
+
+def test_drbg_negative_size() -> None:
+    with pytest.raises(ValueError, match=re.escape("negative argument not allowed")):
+        DRBG().rand_bytes(-1)
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "exc_msg"),
+    [
+        ({"block_size": 0}, "block size must be positive"),
+        (
+            {"block_size": 64, "reseed_interval": 32},
+            "reseed interval must be at least the block size",
+        ),
+    ],
+)
+def test_drbg_erroneous_cases(kwargs: dict[str, int], exc_msg: str) -> None:
+    with pytest.raises(ValueError, match=re.escape(exc_msg)):
+        DRBG(**kwargs)
+
+
+def test_drbg_reseed() -> None:
+    gen = DRBG(block_size=32, reseed_interval=64)
+    gen.rand_bytes(1)
+    key = gen._state.key
+    gen.rand_bytes(32)
+    assert gen._state.key != key
+    gen.reseed()
+    assert gen._state.generated == 0
+    for _ in range(3):
+        gen.rand_bytes(32)
+    assert gen._state.generated == 32
+
+
+def test_drbg_threads() -> None:
+    gen = DRBG(block_size=64)
+    with ThreadPoolExecutor(4) as pool:
+        outputs = list(pool.map(lambda _: gen.rand_bytes(16), range(4)))
+    outputs.append(gen.rand_bytes(16))
+    assert len(set(outputs)) == 5
+
+
+def test_use_drbg(drbg: DRBG) -> None:
+    assert _Cache.source == drbg.rand_bytes
+    assert len(rand_bytes(100)) == 100
+    for _ in range(1000):
+        assert 0.0 <= random() < 1.0
+        assert 1 <= rand_int(1, 6) <= 6
+    use_urandom()
+    assert _Cache.source is os.urandom
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_drbg_fork(drbg: DRBG) -> None:
+    r, w = os.pipe()
+    if (pid := os.fork()) == 0:  # pragma: no cover
+        os.write(w, drbg.rand_bytes(16))
+        os._exit(0)
+    os.waitpid(pid, 0)
+    child = os.read(r, 16)
+    os.close(r)
+    os.close(w)
+    assert child != drbg.rand_bytes(16)
+
+
+def test_fast_mode() -> None:
+    with fast_mode():
+        assert _thread_cache.fast_rng is not None
+        for _ in range(1000):
+            assert 0.0 <= random() < 1.0
+            assert 1 <= rand_int(1, 6) <= 6
+        assert len(rand_alnum(16)) == 16
+        assert passphrase(4).count("-") == 3
+        with fast_mode():
+            assert 0.0 <= random() < 1.0
+        assert _thread_cache.fast_rng is not None
+    assert _thread_cache.fast_rng is None
+    assert _thread_cache.nbits == 0
+    assert len(rand_bytes(16)) == 16
+
+
+def test_fast_mode_streams_differ() -> None:
+    with fast_mode():
+        a = [random() for _ in range(10)]
+    with fast_mode():
+        b = [random() for _ in range(10)]
+    assert a != b
+
+
+def test_fast_mode_threads() -> None:
+    with fast_mode(), ThreadPoolExecutor(1) as pool:
+        assert pool.submit(lambda: _thread_cache.fast_rng).result() is None
+        assert len(pool.submit(rand_bytes, 16).result()) == 16
+
+
+@pytest.mark.parametrize(
+    ("func", "name"),
+    [
+        (lambda: rand_bytes(16), "rand_bytes"),
+        (lambda: rand_hex(16), "rand_hex"),
+        (lambda: rand_urlsafe(16), "rand_urlsafe"),
+        (lambda: rand_into(bytearray(16)), "rand_into"),
+        (lambda: tokens(4), "tokens"),
+        (lambda: rand_password(16), "rand_password"),
+    ],
+)
+def test_fast_mode_refuses_secrets(func: Callable[[], object], name: str) -> None:
+    msg = f"{name} is not available in fast mode"
+    with fast_mode(), pytest.raises(RuntimeError, match=re.escape(msg)):
+        func()
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_fast_mode_fork() -> None:
+    r, w = os.pipe()
+    with fast_mode():
+        if (pid := os.fork()) == 0:  # pragma: no cover
+            os.write(w, random().hex().encode().ljust(32))
+            os._exit(0)
+        os.waitpid(pid, 0)
+        child = os.read(r, 32)
+        os.close(r)
+        os.close(w)
+        assert child != random().hex().encode().ljust(32)
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import ast
+import re
+from array import array
+from collections import Counter
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from ixia import shuffle_file, write_random
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.mark.parametrize("memory_limit", [1 << 30, 2000, 200])
+def test_shuffle_file(tmp_path: Path, memory_limit: int) -> None:
+    lines = [f"line {i}\n".encode() for i in range(1000)]
+    (src := tmp_path / "src.txt").write_bytes(b"".join(lines))
+    dst = tmp_path / "dst.txt"
+    shuffle_file(src, dst, memory_limit=memory_limit, tmp_dir=tmp_path)
+    shuffled = dst.read_bytes().splitlines(keepends=True)
+    assert sorted(shuffled) == sorted(lines)
+    assert shuffled != lines
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["dst.txt", "src.txt"]
+
+
+@pytest.mark.parametrize("memory_limit", [1 << 30, 200])
+def test_shuffle_file_in_place(tmp_path: Path, memory_limit: int) -> None:
+    lines = [f"line {i}\n".encode() for i in range(1000)]
+    (path := tmp_path / "data.txt").write_bytes(b"".join(lines))
+    shuffle_file(path, tmp_path / "." / "data.txt", memory_limit=memory_limit)
+    shuffled = path.read_bytes().splitlines(keepends=True)
+    assert sorted(shuffled) == sorted(lines)
+    assert shuffled != lines
+    assert [p.name for p in tmp_path.iterdir()] == ["data.txt"]
+
+
+@pytest.mark.parametrize("memory_limit", [1 << 30, 10])
+def test_shuffle_file_missing_newline(tmp_path: Path, memory_limit: int) -> None:
+    (src := tmp_path / "src.txt").write_bytes(b"a\nb\nc")
+    shuffle_file(src, dst := tmp_path / "dst.txt", memory_limit=memory_limit)
+    assert sorted(dst.read_bytes().splitlines()) == [b"a", b"b", b"c"]
+    assert dst.read_bytes().endswith(b"\n")
+
+
+def test_shuffle_file_empty(tmp_path: Path) -> None:
+    (src := tmp_path / "src.txt").touch()
+    shuffle_file(src, dst := tmp_path / "dst.txt")
+    assert dst.read_bytes() == b""
+
+
+def test_shuffle_file_uniform(tmp_path: Path) -> None:
+    (src := tmp_path / "src.txt").write_bytes(b"a\nb\nc\n")
+    dst = tmp_path / "dst.txt"
+    counts: Counter[bytes] = Counter()
+    for _ in range(600):
+        shuffle_file(src, dst, memory_limit=4)
+        counts[dst.read_bytes()] += 1
+    assert len(counts) == 6
+    assert all(50 < c < 150 for c in counts.values())
+
+
+def test_shuffle_file_erroneous_cases(tmp_path: Path) -> None:
+    (src := tmp_path / "src.txt").touch()
+    with pytest.raises(ValueError, match=re.escape("memory limit must be positive")):
+        shuffle_file(src, tmp_path / "dst.txt", memory_limit=0)
+
+
+@pytest.mark.parametrize("size", [0, 1, 1000, 100_000])
+def test_write_random(tmp_path: Path, size: int) -> None:
+    path = tmp_path / "random.bin"
+    assert write_random(path, size, chunk=4096) == size
+    data = path.read_bytes()
+    assert len(data) == size
+    if size >= 1000:
+        assert len(set(data)) > 200
+
+
+def test_write_random_fd(tmp_path: Path) -> None:
+    path = tmp_path / "random.bin"
+    with path.open("wb") as f:
+        f.write(b"head")
+        f.flush()
+        assert write_random(f.fileno(), 100) == 100
+        assert not f.closed
+    assert len(path.read_bytes()) == 104
+
+
+def test_write_random_typed(tmp_path: Path) -> None:
+    path = tmp_path / "random.bin"
+    assert write_random(path, 1000, typecode="d", chunk=100) == 8000
+    floats = array("d", path.read_bytes())
+    assert all(0.0 <= x < 1.0 for x in floats)
+    assert len(set(floats)) == 1000
+
+    assert write_random(path, 1000, typecode="q", bounds=(-3, 3), chunk=100) == 8000
+    assert set(array("q", path.read_bytes())) == set(range(-3, 4))
+
+
+def test_write_random_npy(tmp_path: Path) -> None:
+    path = tmp_path / "random.npy"
+    size = write_random(path, 10, typecode="q", bounds=(5, 5), npy=True)
+    data = path.read_bytes()
+    assert len(data) == size
+    assert data[:8] == b"\x93NUMPY\x01\x00"
+    header_size = int.from_bytes(data[8:10], "little")
+    assert (10 + header_size) % 64 == 0
+    header = ast.literal_eval(data[10 : 10 + header_size].decode())
+    assert header == {"descr": "<i8", "fortran_order": False, "shape": (10,)}
+    assert array("q", data[10 + header_size :]).tolist() == [5] * 10
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "exc_type", "exc_msg"),
+    [
+        ({"size": -1}, ValueError, "size must be non-negative"),
+        ({"chunk": 0}, ValueError, "chunk size must be positive"),
+        (
+            {"typecode": "i", "npy": True},
+            ValueError,
+            "unsupported typecode 'i', expected 'B', 'd' or 'q'",
+        ),
+        ({"typecode": "f"}, ValueError, "unsupported typecode 'f'"),
+        ({"bounds": (0, 1)}, ValueError, "bounds are only supported for typecode 'q'"),
+        ({"typecode": "q", "bounds": (1, 0)}, ValueError, "empty range for bounds"),
+        (
+            {"typecode": "q", "bounds": (0, 1 << 63)},
+            OverflowError,
+            "bounds must fit in a signed 64-bit integer",
+        ),
+    ],
+)
+def test_write_random_erroneous_cases(
+    tmp_path: Path, kwargs: dict[str, Any], exc_type: type[Exception], exc_msg: str
+) -> None:
+    with pytest.raises(exc_type, match=re.escape(exc_msg)):
+        write_random(tmp_path / "random.bin", **{"size": 1, **kwargs})
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import os
+import re
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
+
+import pytest
+
+from ixia import rand_ulid, rand_ulids, rand_uuid7, rand_uuid7s
+from ixia.ids import _ulid_state
+
+CROCKFORD_CHARSET = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+
+
+def test_rand_uuid7() -> None:
+    before = time.time_ns() // 1_000_000
+    u = rand_uuid7()
+    after = time.time_ns() // 1_000_000
+    assert u.version == 7
+    assert u.variant == uuid.RFC_4122
+    assert before <= u.int >> 80 <= after
+
+
+def test_rand_uuid7s_monotonic() -> None:
+    out = rand_uuid7s(k=10_000)
+    assert len(out) == 10_000
+    assert out == sorted(set(out))
+    assert all(u.version == 7 and u.variant == uuid.RFC_4122 for u in out)
+    assert rand_uuid7() > out[-1]
+    assert rand_uuid7s(k=0) == []
+
+
+def test_rand_ulid() -> None:
+    before = time.time_ns() // 1_000_000
+    u = rand_ulid()
+    after = time.time_ns() // 1_000_000
+    assert len(u) == 26
+    assert all(c in CROCKFORD_CHARSET for c in u)
+    value = sum(CROCKFORD_CHARSET.index(c) << (5 * i) for i, c in enumerate(u[::-1]))
+    assert before <= value >> 80 <= after
+
+
+def test_rand_ulids_monotonic() -> None:
+    out = rand_ulids(k=10_000)
+    assert len(out) == 10_000
+    assert out == sorted(set(out))
+    assert rand_ulid() > out[-1]
+
+
+def test_monotonic_across_threads() -> None:
+    with ThreadPoolExecutor(8) as pool:
+        batches = list(pool.map(lambda _: rand_uuid7s(k=1000), range(16)))
+    out = [u for batch in batches for u in batch]
+    assert len(set(out)) == len(out)
+    for batch in batches:
+        assert batch == sorted(batch)
+
+
+def test_clock_going_backwards() -> None:
+    first = rand_ulid()
+    with patch("time.time_ns", return_value=0):
+        assert rand_ulid() > first
+
+
+def test_counter_overflow() -> None:
+    now = time.time_ns() // 1_000_000 + 10_000
+    with patch("time.time_ns", return_value=now * 1_000_000):
+        first = rand_ulid()
+        _ulid_state.counter = (1 << 80) - 1
+        second = rand_ulid()
+    assert second > first
+    assert _ulid_state.ms == now + 1
+    _ulid_state.reset()
+
+
+@patch("time.time_ns", return_value=(1 << 48) * 1_000_000)
+def test_timestamp_overflow(time_ns: Mock) -> None:
+    msg = "timestamp does not fit in 48 bits"
+    with pytest.raises(OverflowError, match=re.escape(msg)):
+        rand_uuid7()
+    time_ns.assert_called_once()
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_fork_resets_state() -> None:
+    rand_ulid()
+    r, w = os.pipe()
+    if (pid := os.fork()) == 0:  # pragma: no cover
+        os.write(w, str(_ulid_state.ms).encode())
+        os._exit(0)
+    os.waitpid(pid, 0)
+    child_ms = os.read(r, 32)
+    os.close(r)
+    os.close(w)
+    assert child_ms == b"-1"
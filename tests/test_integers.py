@@ -1,9 +1,22 @@
 import re
+from decimal import Decimal
+from fractions import Fraction
 from string import ascii_letters, digits
 
 import pytest
 
-from ixia import rand_bits, rand_bool, rand_int, rand_ints, rand_range, universe_rand
+from ixia import (
+    integers,
+    rand_below,
+    rand_bits,
+    rand_bool,
+    rand_bools,
+    rand_int,
+    rand_ints,
+    rand_range,
+    universe_rand,
+)
+from ixia.distributions import _rand_bits
 
 URLSAFE_CHARSET = ascii_letters + digits + "_-"
 
@@ -14,6 +27,57 @@ def test_bool() -> None:
     assert 200 < sum(rand_bool() for _ in range(1000)) < 800
     assert sum(rand_bool(p=0.9) for _ in range(1000)) > 500
     assert sum(rand_bool(p=0.01) for _ in range(1000)) < 100
+    assert 1200 < sum(rand_bool(p=0.3) for _ in range(5000)) < 1800
+
+
+def test_rand_bools() -> None:
+    assert rand_bools(0) == 0
+    assert rand_bools(10, p=0.0) == 0
+    assert rand_bools(10, p=1.0) == 0b1111111111
+    assert 0 <= rand_bools(100) < 1 << 100
+    assert 3500 < bin(rand_bools(10_000)).count("1") < 6500
+    assert bin(rand_bools(10_000, p=0.1)).count("1") < 1500
+    assert 0 <= rand_bools(5, p=0.25) < 1 << 5
+
+
+@pytest.mark.parametrize("p", [Fraction(1, 3), Decimal("0.3"), 0.3])
+def test_rand_bool_non_dyadic(p: float) -> None:
+    hits = sum(rand_bool(p) for _ in range(20_000))
+    assert 20_000 * float(p) - 400 < hits < 20_000 * float(p) + 400
+    hits = bin(rand_bools(20_000, p)).count("1")
+    assert 20_000 * float(p) - 400 < hits < 20_000 * float(p) + 400
+
+
+def test_rand_bools_negative() -> None:
+    with pytest.raises(
+        ValueError, match=re.escape("number of bools must be non-negative")
+    ):
+        rand_bools(-1)
+
+
+@pytest.mark.parametrize(("n", "max_bits"), [(3, 2.8), (6, 3.8), (129, 9.5)])
+def test_rand_below_entropy(
+    monkeypatch: pytest.MonkeyPatch, n: int, max_bits: float
+) -> None:
+    used = 0
+
+    def counting_rand_bits(k: int) -> int:
+        nonlocal used
+        used += k
+        return _rand_bits(k)
+
+    monkeypatch.setattr(integers, "_rand_bits", counting_rand_bits)
+    values = [rand_below(n) for _ in range(10_000)]
+    assert set(values) == set(range(n))
+    assert used / 10_000 < max_bits
+
+
+@pytest.mark.parametrize("n", [1, 2, 3, 6, 7, 64, 100, 256, 257, 1000])
+def test_rand_below(n: int) -> None:
+    values = [rand_below(n) for _ in range(3000)]
+    assert all(0 <= x < n for x in values)
+    if n <= 7:
+        assert set(values) == set(range(n))
 
 
 def test_universe_rand() -> None:
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import re
+
+import pytest
+
+from ixia import gauss, parallel, use_drbg, use_urandom
+
+
+def test_parallel_random() -> None:
+    with parallel.random(10_000, processes=2) as out:
+        assert len(out) == 10_000
+        assert all(0.0 <= x < 1.0 for x in out.values)
+        assert len(set(out.tolist())) == 10_000
+
+
+def test_parallel_rand_ints() -> None:
+    with parallel.rand_ints(-5, 5, k=1000, processes=3) as out:
+        assert set(out.tolist()) == set(range(-5, 6))
+
+
+def test_parallel_variates() -> None:
+    with parallel.variates(gauss, 10.0, 0.0, k=100, processes=2) as out:
+        assert out.tolist() == [10.0] * 100
+
+
+def test_parallel_rand_bytes() -> None:
+    with parallel.rand_bytes(200_000, processes=2) as out:
+        data = out.values.tobytes()
+        assert len(data) == 200_000
+        # The two halves come from different workers
+        assert data[:100_000] != data[100_000:]
+
+
+def test_parallel_drbg() -> None:
+    use_drbg()
+    try:
+        with parallel.random(100, processes=2) as out:
+            assert len(set(out.tolist())) == 100
+    finally:
+        use_urandom()
+
+
+def test_parallel_empty() -> None:
+    with parallel.random(0, processes=2) as out:
+        assert not out.tolist()
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "exc_type", "exc_msg"),
+    [
+        ({"k": -1}, ValueError, "k must be non-negative"),
+        ({"k": 1, "processes": 0}, ValueError, "number of processes must be positive"),
+        (
+            {"k": 1, "b": 1 << 63},
+            OverflowError,
+            "bounds must fit in a signed 64-bit integer",
+        ),
+    ],
+)
+def test_parallel_erroneous_cases(
+    kwargs: dict[str, int], exc_type: type[BaseException], exc_msg: str
+) -> None:
+    with pytest.raises(exc_type, match=re.escape(exc_msg)):
+        parallel.rand_ints(**{"a": 0, "b": 1, **kwargs})
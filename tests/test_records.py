@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import csv
+import datetime as dt
+import io
+import json
+import re
+from typing import Any
+
+import pytest
+
+from ixia import choices, rand_alnum, rand_date, rand_ints
+from ixia.records import Column, columns, row_groups, write_csv, write_jsonl
+
+SCHEMA = {
+    "id": Column(rand_ints, 1, 100),
+    "plan": Column(choices, ["free", "pro"], [3, 1]),
+    "name": Column.each(rand_alnum, 8),
+    "born": Column.each(rand_date, "2000-01-01", "2000-12-31"),
+}
+
+
+def test_columns() -> None:
+    table = columns(SCHEMA, 100)
+    assert list(table) == ["id", "plan", "name", "born"]
+    assert all(len(values) == 100 for values in table.values())
+    assert all(1 <= x <= 100 for x in table["id"])
+    assert set(table["plan"]) <= {"free", "pro"}
+    assert all(len(name) == 8 for name in table["name"])
+    assert all(isinstance(d, dt.date) and d.year == 2000 for d in table["born"])
+    assert columns(SCHEMA, 0) == {"id": [], "plan": [], "name": [], "born": []}
+
+
+def test_row_groups() -> None:
+    sizes = [len(group["id"]) for group in row_groups(SCHEMA, 250, group_size=100)]
+    assert sizes == [100, 100, 50]
+    assert not list(row_groups(SCHEMA, 0))
+
+
+def test_write_csv() -> None:
+    buf = io.StringIO(newline="")
+    write_csv(buf, SCHEMA, 25, group_size=10)
+    rows = list(csv.reader(io.StringIO(buf.getvalue())))
+    assert rows[0] == ["id", "plan", "name", "born"]
+    assert len(rows) == 26
+    assert all(dt.date.fromisoformat(row[3]) for row in rows[1:])
+
+    buf = io.StringIO(newline="")
+    write_csv(buf, SCHEMA, 3, header=False)
+    assert len(buf.getvalue().splitlines()) == 3
+
+
+def test_write_jsonl() -> None:
+    buf = io.StringIO()
+    write_jsonl(buf, SCHEMA, 25, group_size=7)
+    records = [json.loads(line) for line in buf.getvalue().splitlines()]
+    assert len(records) == 25
+    assert all(set(record) == set(SCHEMA) for record in records)
+    assert all(isinstance(record["id"], int) for record in records)
+
+
+@pytest.mark.parametrize(
+    ("schema", "kwargs", "exc_msg"),
+    [
+        (SCHEMA, {"k": -1}, "k must be non-negative"),
+        (SCHEMA, {"k": 1, "group_size": 0}, "group size must be positive"),
+        (
+            {"bad": lambda k: [0] * (k + 1)},
+            {"k": 2},
+            "column 'bad' returned 3 values instead of 2",
+        ),
+    ],
+)
+def test_row_groups_erroneous_cases(
+    schema: Any, kwargs: dict[str, int], exc_msg: str
+) -> None:
+    with pytest.raises(ValueError, match=re.escape(exc_msg)):
+        list(row_groups(schema, **kwargs))
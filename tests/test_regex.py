@@ -0,0 +1,106 @@
+import re
+
+import pytest
+
+from ixia import RegexGenerator, rand_regex
+from ixia.regex import PRINTABLE_CHARSET, _below, _cached_generator, _Node
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    [
+        r"[A-Z]{3}-\d{6}",
+        r"(ab|c)*?x",
+        r"[^a-z\W]+",
+        r".{3}",
+        r"(?i)ab[c-e]",
+        r"(?i:x)y",
+        r"^\w+@(gmail|example)\.com$",
+        r"\A^[ab]{2}$\Z",
+        r"a{2,}b?",
+        r"[^\d]?\s\S",
+        r"[一-鿿]{2}",
+        r"(?x) a b  # comment",
+        r"",
+    ],
+)
+def test_regex_generator(pattern: str) -> None:
+    gen = RegexGenerator(pattern)
+    for s in [*gen.strings(k=1000), gen.string(), rand_regex(pattern)]:
+        assert re.fullmatch(pattern, s)
+
+
+def test_regex_generator_distribution() -> None:
+    strings = RegexGenerator(r"[a-d]|x{1,2}").strings(k=10_000)
+    assert set(strings) == {"a", "b", "c", "d", "x", "xx"}
+    assert 4500 < sum(s.startswith("x") for s in strings) < 5500
+    assert 2000 < strings.count("xx") < 3000
+
+
+def test_regex_generator_max_repeat() -> None:
+    strings = RegexGenerator("a*", max_repeat=3).strings(k=1000)
+    assert set(strings) == {"", "a", "aa", "aaa"}
+    assert RegexGenerator("a+b{2,}", max_repeat=0).string() == "abb"
+
+
+def test_regex_generator_compiled_pattern() -> None:
+    pattern = re.compile("ab", re.IGNORECASE)
+    assert set(RegexGenerator(pattern).strings(k=1000)) == {"ab", "aB", "Ab", "AB"}
+    assert rand_regex(pattern).lower() == "ab"
+
+
+def test_regex_generator_negated_classes() -> None:
+    strings = RegexGenerator("[^a]").strings(k=10_000)
+    assert set(strings) == set(PRINTABLE_CHARSET) - {"a"}
+    assert set(RegexGenerator(".").strings(k=10_000)) == set(PRINTABLE_CHARSET)
+
+
+def test_rand_regex_cache() -> None:
+    _cached_generator.cache_clear()
+    rand_regex(r"\d{4}")
+    rand_regex(r"\d{4}")
+    assert _cached_generator.cache_info().hits == 1
+
+
+@pytest.mark.parametrize("n", [1, 2, 10, 255, 256, 257, 65536, 70_000])
+def test_below(n: int) -> None:
+    values = _below(n, 5000)
+    assert len(values) == 5000
+    assert all(0 <= v < n for v in values)
+
+
+@pytest.mark.parametrize(
+    ("pattern", "exc_type", "exc_msg"),
+    [
+        (r"(a)\1", ValueError, "unsupported regex syntax: GROUPREF"),
+        (r"a(?=b)", ValueError, "unsupported regex syntax: ASSERT"),
+        (r"\bx", ValueError, "unsupported regex syntax: AT_BOUNDARY"),
+        ("a^b", ValueError, "anchors are only supported at either end of the pattern"),
+        ("(^a|b)", ValueError, "anchors are only supported at either end"),
+        ("a$b", ValueError, "anchors are only supported at either end"),
+        (
+            r"[^\x00-\x7f]",
+            ValueError,
+            "character class matches no printable ASCII character",
+        ),
+        (r"(", re.error, "missing ), unterminated subpattern"),
+        (re.compile(b"a"), TypeError, "pattern must be a string"),
+    ],
+)
+def test_regex_generator_erroneous_cases(
+    pattern: str, exc_type: type[Exception], exc_msg: str
+) -> None:
+    with pytest.raises(exc_type, match=re.escape(exc_msg)):
+        RegexGenerator(pattern)
+
+
+def test_regex_generator_negative_values() -> None:
+    with pytest.raises(ValueError, match=re.escape("max_repeat must be non-negative")):
+        RegexGenerator("a", max_repeat=-1)
+    with pytest.raises(ValueError, match=re.escape("k must be non-negative")):
+        RegexGenerator("a").strings(k=-1)
+
+
+def test_node_is_abstract() -> None:
+    with pytest.raises(TypeError, match="abstract"):
+        _Node()  # type: ignore[abstract]
@@ -1,10 +1,24 @@
+import math
 import re
+from collections import Counter
 from enum import Enum
-from typing import Any
+from typing import Any, Callable
 
 import pytest
 
-from ixia import beta_variate, choice, choices, perm, rand_enum, sample, shuffled
+from ixia import (
+    DynamicWeightedSampler,
+    beta_variate,
+    choice,
+    choices,
+    perm,
+    rand_enum,
+    rand_filter,
+    rand_indices,
+    sample,
+    shuffled,
+    sorted_sample,
+)
 
 TEST_LIST = [6, 3, 9, 1, 2, 4, 8, 0, 5, 7]
 TEST_TUPLE = tuple(TEST_LIST)
@@ -137,3 +151,149 @@ def test_perm() -> None:
         p = perm(size)
         assert len(p) == size
         assert set(p) == set(range(size))
+
+
+@pytest.mark.parametrize(
+    ("n", "k"), [(0, 0), (5, 0), (5, 1), (10, 10), (20, 3), (1000, 5), (10**12, 1000)]
+)
+def test_sorted_sample(n: int, k: int) -> None:
+    for _ in range(100):
+        values = list(sorted_sample(n, k))
+        assert len(values) == k
+        assert all(0 <= a < b < n for a, b in zip(values, values[1:]))
+        assert all(0 <= x < n for x in values)
+
+
+def test_sorted_sample_uniform() -> None:
+    counts = Counter(x for _ in range(10_000) for x in sorted_sample(200, 10))
+    assert set(counts) == set(range(200))
+    assert all(300 < c < 700 for c in counts.values())
+
+
+@pytest.mark.parametrize(("n", "k"), [(1, 2), (1, -1)])
+def test_sorted_sample_erroneous_cases(n: int, k: int) -> None:
+    with pytest.raises(
+        ValueError, match=re.escape("sample larger than sequence or is negative")
+    ):
+        sorted_sample(n, k)
+
+
+def test_dynamic_weighted_sampler() -> None:
+    sampler = DynamicWeightedSampler("abcd", [1, 2, 3, 4])
+    assert len(sampler) == 4
+    assert sampler.total == 10.0
+    counts = Counter(sampler.choices(k=10_000))
+    assert 700 < counts["a"] < 1300
+    assert 3500 < counts["d"] < 4500
+
+    sampler.update(0, 0)
+    assert sampler.remove(3) == "d"
+    assert len(sampler) == 3
+    assert sampler.total == 5.0
+    assert set(sampler.choices(k=1000)) == {"b", "c"}
+
+    assert sampler.add("e", 5) == 3
+    assert sampler.add("f", 1) == 4
+    assert sampler.weight(4) == 1.0
+    assert sampler.total == 11.0
+    assert set(sampler.choices(k=1000)) == {"b", "c", "e", "f"}
+    assert sampler.choice() in "bcef"
+
+
+def test_dynamic_weighted_sampler_many_updates() -> None:
+    sampler = DynamicWeightedSampler(range(100), [1.0] * 100)
+    for i in range(10_000):
+        sampler.update(i % 100, (i % 7) / 3)
+    assert math.isclose(sampler.total, sum(sampler.weight(i) for i in range(100)))
+    for i in range(100):
+        sampler.update(i, 0.0)
+    sampler.update(42, 0.1)
+    assert sampler.choices(k=100) == [42] * 100
+
+
+@pytest.mark.parametrize(
+    ("action", "exc_type", "exc_msg"),
+    [
+        (
+            lambda: DynamicWeightedSampler("ab", [1]),
+            ValueError,
+            "the number of weights does not match the sequence",
+        ),
+        (
+            lambda: DynamicWeightedSampler("a", [-1]),
+            ValueError,
+            "weights must be non-negative and finite",
+        ),
+        (
+            lambda: DynamicWeightedSampler("a", [math.inf]),
+            ValueError,
+            "weights must be non-negative and finite",
+        ),
+        (
+            lambda: DynamicWeightedSampler("a", [0]).choice(),
+            ValueError,
+            "total of weights must be greater than zero",
+        ),
+        (
+            lambda: DynamicWeightedSampler().choice(),
+            ValueError,
+            "total of weights must be greater than zero",
+        ),
+        (lambda: DynamicWeightedSampler("a", [1]).update(1, 1), IndexError, "no item"),
+    ],
+)
+def test_dynamic_weighted_sampler_erroneous_cases(
+    action: Callable[[], object], exc_type: type[Exception], exc_msg: str
+) -> None:
+    with pytest.raises(exc_type, match=re.escape(exc_msg)):
+        action()
+
+
+def test_dynamic_weighted_sampler_removed_index() -> None:
+    sampler = DynamicWeightedSampler("ab", [1, 1])
+    sampler.remove(0)
+    with pytest.raises(IndexError, match=re.escape("no item at index 0")):
+        sampler.weight(0)
+
+
+@pytest.mark.parametrize("p", [0.001, 0.1, 0.5, 0.9])
+def test_rand_indices(p: float) -> None:
+    n = 100_000
+    indices = list(rand_indices(n, p))
+    assert indices == sorted(set(indices))
+    assert all(0 <= i < n for i in indices)
+    assert math.isclose(len(indices), n * p, rel_tol=5 / math.sqrt(n * p))
+
+
+def test_rand_indices_edge_cases() -> None:
+    assert list(rand_indices(10, 0.0)) == []
+    assert list(rand_indices(10, 1.0)) == list(range(10))
+    assert list(rand_indices(0, 0.5)) == []
+    assert next(rand_indices(10**18, 1e-12)) < 10**18
+    assert list(rand_indices(10, 1e-320)) in ([], [0])
+    counts = Counter(i for _ in range(10_000) for i in rand_indices(4, 0.5))
+    assert all(4500 < counts[i] < 5500 for i in range(4))
+
+
+def test_rand_filter() -> None:
+    items = [str(i) for i in range(10_000)]
+    picked = list(rand_filter(items, 0.1))
+    assert set(picked) <= set(items)
+    assert picked == sorted(picked, key=int)
+    assert 800 < len(picked) < 1200
+    assert list(rand_filter(iter("abc"), 1.0)) == ["a", "b", "c"]
+    assert list(rand_filter("abc", 0.0)) == []
+    assert list(rand_filter([], 0.5)) == []
+    assert list(rand_filter("abc", 1e-320)) in ([], ["a"])
+    unbounded = rand_filter(iter(int, 1), 0.01)
+    assert [next(unbounded) for _ in range(10)] == [0] * 10
+
+
+@pytest.mark.parametrize("p", [-0.1, 1.1, math.nan])
+def test_rand_indices_erroneous_cases(p: float) -> None:
+    with pytest.raises(ValueError, match=re.escape("p must be in range [0, 1]")):
+        rand_indices(10, p)
+    with pytest.raises(ValueError, match=re.escape("p must be in range [0, 1]")):
+        rand_filter("abc", p)
+    with pytest.raises(ValueError, match=re.escape("n must be non-negative")):
+        rand_indices(-1, 0.5)
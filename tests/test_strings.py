@@ -1,20 +1,36 @@
+import bz2
+import gzip
+import lzma
 import math
+import mmap
+import re
+import shutil
 import string
-from io import StringIO
+import uuid
+from array import array
+from collections import Counter
+from io import BytesIO, StringIO
 from pathlib import Path
-from unittest.mock import patch
+from typing import Any
 
 import pytest
 
 from ixia import (
+    RandomStream,
     passphrase,
     rand_alnum,
     rand_bytes,
     rand_hex,
+    rand_into,
     rand_line,
+    rand_password,
     rand_printable,
     rand_urlsafe,
+    tokens,
+    use_drbg,
+    use_urandom,
 )
+from ixia.strings import _embedded_words
 
 URLSAFE_CHARSET = string.ascii_letters + string.digits + "_-"
 
@@ -25,16 +41,29 @@ def test_passphrase(tmp_path: Path) -> None:
     assert passphrase(1, words_path=path)
 
 
-def test_passphrase_nonexistent() -> None:
-    with patch("ixia.strings.Path") as path_mock:
-        path_inst = path_mock.return_value
-        path_inst.exists.return_value = False
-        path_inst.__eq__.return_value = True
-        with pytest.raises(NotImplementedError):
-            passphrase(1)
+@pytest.mark.parametrize("compress", [gzip.compress, lzma.compress, bz2.compress])
+def test_passphrase_compressed(tmp_path: Path, compress: Any) -> None:
+    (path := tmp_path / "words").write_bytes(compress(b"one\ntwo\nthree\n"))
+    assert set(passphrase(20, words_path=path).split("-")) <= {"one", "two", "three"}
 
-        # Ignore the path entirely for n < 1
-        assert not passphrase(0)
+
+def test_passphrase_embedded() -> None:
+    words = passphrase(1000).split("-")
+    assert len(words) == 1000
+    assert all(w.isalpha() and w.islower() for w in words)
+    assert len(set(words)) > 500
+    assert len(passphrase(4, sep=" ").split(" ")) == 4
+
+
+def test_embedded_word_list() -> None:
+    words = _embedded_words()
+    assert len(words) == 2048
+    assert len(set(words)) == 2048
+    assert list(words) == sorted(words)
+    assert words[-1] == words[2047]
+    assert words[:2] == [words[0], words[1]]
+    with pytest.raises(IndexError):
+        words[2048]
 
 
 def test_bytes() -> None:
@@ -55,6 +84,54 @@ def test_hex() -> None:
             assert all(c in string.hexdigits for c in val)
 
 
+def test_rand_into() -> None:
+    buf = bytearray(10_000)
+    assert rand_into(buf) == 10_000
+    assert buf.count(0) < 500
+
+    arr = array("d", [0.0] * 100)
+    assert rand_into(arr) == 800
+    assert len(set(arr)) == 100
+
+    with mmap.mmap(-1, 4096) as m:
+        assert rand_into(m) == 4096
+        assert m[:] != bytes(4096)
+
+    assert rand_into(bytearray()) == 0
+
+
+def test_rand_into_drbg() -> None:
+    use_drbg()
+    try:
+        buf = bytearray(3_000_000)
+        assert rand_into(buf) == 3_000_000
+        assert buf[-1000:] != bytes(1000)
+    finally:
+        use_urandom()
+
+
+def test_rand_into_readonly() -> None:
+    with pytest.raises(TypeError, match="buffer must be writable"):
+        rand_into(b"immutable")
+
+
+def test_random_stream() -> None:
+    out = BytesIO()
+    shutil.copyfileobj(RandomStream(100_000), out)
+    assert len(out.getvalue()) == 100_000
+
+    stream = RandomStream()
+    assert len(stream.read(50)) == 50
+    buf = bytearray(1 << 16)
+    assert stream.readinto(buf) == 1 << 16
+    stream.close()
+    with pytest.raises(ValueError, match="I/O operation on closed stream"):
+        stream.readinto(buf)
+
+    with pytest.raises(ValueError, match="size must be non-negative"):
+        RandomStream(-1)
+
+
 def test_rand_line(tmp_path: Path) -> None:
     lines = ("hello", "there", "general", "kenobi")
     (path := tmp_path / "sample.txt").write_text("\n".join(lines))
@@ -69,6 +146,19 @@ def test_rand_line(tmp_path: Path) -> None:
         assert rand_line(f) not in lines  # type: ignore[comparison-overlap]
 
 
+@pytest.mark.parametrize("compress", [gzip.compress, lzma.compress, bz2.compress])
+def test_rand_line_compressed(tmp_path: Path, compress: Any) -> None:
+    lines = [f"line {i}" for i in range(100)]
+    (path := tmp_path / "sample.dat").write_bytes(compress("\n".join(lines).encode()))
+    counts = Counter(rand_line(path) for _ in range(2000))
+    assert set(counts) <= set(lines)
+    assert len(counts) > 90
+
+    (path := tmp_path / "empty.dat").write_bytes(compress(b""))
+    with pytest.raises(EOFError):
+        rand_line(path)
+
+
 def test_rand_line_bin(tmp_path: Path) -> None:
     lines = (b"hello", b"there", b"general", b"kenobi")
     (path := tmp_path / "sample.bin").write_bytes(b"\n".join(lines))
@@ -118,3 +208,106 @@ def test_rand_alnum() -> None:
         val = rand_alnum(i)
         assert len(val) == i
         assert all(map(str.isalnum, val))
+
+
+@pytest.mark.parametrize("nbytes", [0, 1, 2, 3, 5, 16, 32])
+def test_tokens(nbytes: int) -> None:
+    b64 = tokens(100, nbytes)
+    assert len(b64) == 100
+    assert all(len(t) == len(rand_urlsafe(nbytes)) for t in b64)
+    assert all(c in URLSAFE_CHARSET for t in b64 for c in t)
+
+    hex_ = tokens(100, nbytes, encoding="hex")
+    assert all(len(t) == 2 * nbytes for t in hex_)
+    assert all(c in string.hexdigits for t in hex_ for c in t)
+
+    b32 = tokens(100, nbytes, encoding="base32")
+    assert all(len(t) == math.ceil(8 / 5 * nbytes) for t in b32)
+    assert all(c in string.ascii_uppercase + "234567" for t in b32 for c in t)
+
+    if nbytes >= 5:
+        assert len(set(b64 + hex_ + b32)) == 300
+
+
+def test_tokens_uuid4() -> None:
+    out = tokens(1000, encoding="uuid4")
+    assert len(set(out)) == 1000
+    for t in out:
+        u = uuid.UUID(t)
+        assert str(u) == t
+        assert u.version == 4
+        assert u.variant == uuid.RFC_4122
+
+
+def test_tokens_unique() -> None:
+    out = tokens(256, 1, encoding="hex", unique=True)
+    assert sorted(out) == [f"{i:02x}" for i in range(256)]
+    assert tokens(1, 0, unique=True) == [""]
+    assert tokens(0, 0, unique=True) == []
+    assert len(tokens(2, 1 << 16, encoding="hex", unique=True)) == 2
+    with pytest.raises(
+        ValueError, match="not enough possible tokens for a unique batch"
+    ):
+        tokens(2, 0, unique=True)
+    with pytest.raises(
+        ValueError, match="not enough possible tokens for a unique batch"
+    ):
+        tokens(257, 1, encoding="hex", unique=True)
+
+
+@pytest.mark.parametrize(
+    ("args", "kwargs", "exc_msg"),
+    [
+        ((-1,), {}, "k must be non-negative"),
+        ((1, -1), {}, "negative argument not allowed"),
+        ((1,), {"encoding": "base58"}, "unknown token encoding: 'base58'"),
+    ],
+)
+def test_tokens_erroneous_cases(
+    args: tuple[int, ...], kwargs: dict[str, Any], exc_msg: str
+) -> None:
+    with pytest.raises(ValueError, match=re.escape(exc_msg)):
+        tokens(*args, **kwargs)
+
+
+def test_rand_password() -> None:
+    for length in range(4, 100):
+        password = rand_password(length)
+        assert len(password) == length
+        assert any(c in string.ascii_lowercase for c in password)
+        assert any(c in string.ascii_uppercase for c in password)
+        assert any(c in string.digits for c in password)
+        assert any(c in string.punctuation for c in password)
+
+    policy = {string.ascii_letters: 0, string.digits: 3}
+    for _ in range(100):
+        password = rand_password(8, policy, exclude="0O1lI")
+        assert sum(c.isdigit() for c in password) >= 3
+        assert not set(password) & set("0O1lI")
+
+    assert rand_password(0, {}) == ""
+
+
+def test_rand_password_uniform() -> None:
+    # 27 strings of length 3 over "ab0", minus 1 without letters and 8 without "0"
+    counts = Counter(rand_password(3, {"ab": 1, "0": 1}) for _ in range(18_000))
+    assert len(counts) == 18
+    assert all(800 < c < 1200 for c in counts.values())
+
+
+@pytest.mark.parametrize(
+    ("args", "kwargs", "exc_msg"),
+    [
+        ((-1,), {}, "length must be non-negative"),
+        ((3,), {}, "no password satisfies the policy"),
+        ((5, {"abc": 1, "cde": 1}), {}, "character sets must be disjoint"),
+        ((5, {"abc": 1, "0": 1}), {"exclude": "0"}, "no password satisfies the policy"),
+        ((5, {"abc": -1}), {}, "minimum counts must be non-negative"),
+        ((1, {}), {}, "no password satisfies the policy"),
+    ],
+)
+def test_rand_password_erroneous_cases(
+    args: tuple[Any, ...], kwargs: dict[str, Any], exc_msg: str
+) -> None:
+    with pytest.raises(ValueError, match=re.escape(exc_msg)):
+        rand_password(*args, **kwargs)
@@ -0,0 +1,37 @@
+"""
+Build the embedded passphrase word list `src/ixia/words.bin` from `words.txt`.
+
+Layout (all integers are unsigned 16-bit little-endian):
+the number of words `n`, then `n + 1` offsets into the blob, then the blob of
+all lowercase ASCII words concatenated.
+"""
+
+from __future__ import annotations
+
+import sys
+from array import array
+from pathlib import Path
+
+SOURCE = Path(__file__).with_name("words.txt")
+TARGET = Path(__file__).parents[1] / "src" / "ixia" / "words.bin"
+
+
+def main() -> None:
+    words = sorted({w.strip().lower() for w in SOURCE.read_text().split()})
+    blob = "".join(words).encode("ascii")
+    offsets = array("H", [0])
+    for word in words:
+        offsets.append(offsets[-1] + len(word))
+    header = array("H", [len(words)])
+    if len(blob) >= 1 << 16:
+        msg = "word list does not fit in 16-bit offsets"
+        raise ValueError(msg)
+    if sys.byteorder == "big":
+        header.byteswap()
+        offsets.byteswap()
+    TARGET.write_bytes(header.tobytes() + offsets.tobytes() + blob)
+    print(f"wrote {len(words)} words ({TARGET.stat().st_size} bytes) to {TARGET}")
+
+
+if __name__ == "__main__":
+    main()